@@ -1,9 +1,15 @@
+import calendar
+from collections import OrderedDict
+import copy
 from datetime import datetime, timedelta
+import itertools
 import json
+import os
 import shutil
 import sqlite3
 import sys
 import tempfile
+import threading
 import uuid
 import zipfile
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
@@ -11,105 +17,536 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QListWidget, QCalendarWidget, QFileDialog,
                              QFormLayout, QGroupBox, QSplitter, QTabWidget,
                              QMessageBox, QComboBox,QScrollArea, QFrame, QLineEdit, 
-                             QDateEdit, QDateTimeEdit, QSpinBox, QListWidgetItem)
-from PyQt5.QtCore import Qt, QDate, QDateTime
-from PyQt5.QtGui import QIcon, QFont
+                             QDateEdit, QDateTimeEdit, QSpinBox, QListWidgetItem,
+                             QListView, QStyledItemDelegate, QStyle, QStyleOptionViewItem,
+                             QStyleOptionButton)
+from PyQt5.QtCore import (Qt, QDate, QDateTime, QTimer, QObject, QRunnable,
+                          QThreadPool, pyqtSignal, QAbstractListModel, QModelIndex, QSize,
+                          QRect, QEvent)
+from PyQt5.QtGui import QIcon, QFont, QFontMetrics, QColor, QPainter, QPalette, QPixmap
 from pathlib import Path
 
+# Schema for a new database, run as a single script by setup_database
+SCHEMA_TABLES = """
+    CREATE TABLE IF NOT EXISTS memories (
+        id TEXT PRIMARY KEY,
+        title TEXT NOT NULL,
+        content TEXT,
+        media_path TEXT,
+        created_date TEXT NOT NULL,
+        unlock_date TEXT NOT NULL,
+        unlock_type TEXT NOT NULL,
+        unlock_conditions TEXT,
+        is_unlocked INTEGER DEFAULT 0,
+        category TEXT,
+        mood TEXT,
+        importance INTEGER DEFAULT 3
+    );
+
+    -- Tags for each memory
+    CREATE TABLE IF NOT EXISTS memory_tags (
+        memory_id TEXT NOT NULL,
+        tag TEXT NOT NULL,
+        PRIMARY KEY (memory_id, tag),
+        FOREIGN KEY (memory_id) REFERENCES memories(id) ON DELETE CASCADE
+    ) WITHOUT ROWID;
+
+    -- Reactions to unlocked memories
+    CREATE TABLE IF NOT EXISTS responses (
+        id TEXT PRIMARY KEY,
+        memory_id TEXT NOT NULL,
+        response_content TEXT NOT NULL,
+        response_date TEXT NOT NULL,
+        response_mood TEXT,
+        FOREIGN KEY (memory_id) REFERENCES memories (id) ON DELETE CASCADE
+    );
+
+    CREATE TABLE IF NOT EXISTS categories (
+        id TEXT PRIMARY KEY,
+        name TEXT UNIQUE NOT NULL,
+        description TEXT,
+        icon TEXT
+    ) WITHOUT ROWID;
+"""
+
+# Indexes are created after any upgraded tables have been copied back,
+# since indexes on a table moved aside go away with it
+SCHEMA_INDEXES = """
+    -- Partial covering index for the locked-by-unlock-date range queries.
+    -- Only locked memories are indexed, so unlocking a memory just drops
+    -- its entry. It replaces the earlier full index on is_unlocked; the
+    -- trailing is_unlocked column lets SQLite treat the index as covering.
+    DROP INDEX IF EXISTS idx_memories_upcoming;
+    CREATE INDEX IF NOT EXISTS idx_memories_locked
+    ON memories (unlock_date, id, title, created_date, category, importance, is_unlocked)
+    WHERE is_unlocked = 0;
+
+    -- Unlocked memories, newest unlock first, for the unlocked tab
+    CREATE INDEX IF NOT EXISTS idx_memories_unlocked
+    ON memories (unlock_date DESC) WHERE is_unlocked = 1;
+
+    -- Category filters, already split by lock state and in unlock order
+    -- so filtering the unlocked tab by category needs no sort. It
+    -- replaces the earlier index on category alone.
+    DROP INDEX IF EXISTS idx_memories_category;
+    CREATE INDEX IF NOT EXISTS idx_memories_category_unlock
+    ON memories (category, is_unlocked, unlock_date);
+
+    -- Tag lookups
+    CREATE INDEX IF NOT EXISTS idx_memory_tags_tag ON memory_tags (tag);
+
+    -- Responses of a memory, already in display order
+    CREATE INDEX IF NOT EXISTS idx_responses_memory ON responses (memory_id, response_date);
+"""
+
+# SQL statements used on hot paths. Keeping the exact strings at module
+# level lets the sqlite3 statement cache reuse the prepared statements.
+SQL_INSERT_MEMORY = """
+    INSERT INTO memories
+    (id, title, content, media_path, created_date, unlock_date,
+    unlock_type, unlock_conditions, category, mood, importance)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Tags are inserted as one multi-row VALUES statement, with at most
+# MAX_TAGS_PER_INSERT rows to stay under SQLite's bound parameter limit
+SQL_INSERT_TAGS = "INSERT INTO memory_tags (memory_id, tag) VALUES "
+
+MAX_TAGS_PER_INSERT = 400
+
+SQL_SELECT_UPCOMING = """
+    SELECT id, title, created_date, unlock_date, category, importance
+    FROM memories
+    WHERE is_unlocked = 0 AND unlock_date > ?
+    ORDER BY unlock_date ASC
+    LIMIT ?
+"""
+
+# The dashboard only shows the title and the two dates
+SQL_SELECT_UPCOMING_DASHBOARD = """
+    SELECT title, created_date, unlock_date
+    FROM memories
+    WHERE is_unlocked = 0 AND unlock_date > ?
+    ORDER BY unlock_date ASC
+    LIMIT ?
+"""
+
+SQL_UNLOCK_MEMORY = "UPDATE memories SET is_unlocked = 1 WHERE id = ?"
+
+# Tags and responses are removed with the memory by ON DELETE CASCADE
+SQL_DELETE_MEMORY = "DELETE FROM memories WHERE id = ?"
+
+SQL_INSERT_RESPONSE = """
+    INSERT INTO responses
+    (id, memory_id, response_content, response_date, response_mood)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+SQL_COUNT_MEMORIES = """
+    SELECT COUNT(*),
+        COUNT(CASE WHEN is_unlocked = 0 THEN 1 END),
+        COUNT(CASE WHEN is_unlocked = 1 THEN 1 END)
+    FROM memories
+"""
+
+SQL_SELECT_CATEGORIES = "SELECT id, name, description, icon FROM categories"
+
+SQL_UNLOCKABLE_EXISTS = """
+    SELECT EXISTS (
+        SELECT 1 FROM memories WHERE is_unlocked = 0 AND unlock_date <= ?
+    )
+"""
+
+SQL_SELECT_UNLOCKABLE = """
+    SELECT id, title, content, media_path, created_date, unlock_date,
+        category, mood, importance
+    FROM memories
+    WHERE is_unlocked = 0 AND unlock_date <= ?
+"""
+
+# A memory with its tags as a JSON array, which survives commas in tags
+SQL_SELECT_MEMORY = """
+    SELECT m.id, m.title, m.content, m.media_path, m.created_date,
+        m.unlock_date, m.category, c.name AS category_name, m.mood, m.importance,
+        json_group_array(mt.tag) FILTER (WHERE mt.tag IS NOT NULL) AS tags
+    FROM memories m
+    LEFT JOIN categories c ON c.id = m.category
+    LEFT JOIN memory_tags mt ON mt.memory_id = m.id
+    WHERE m.id = ?
+    GROUP BY m.id
+"""
+
+# The memory with its tags and its responses, so the memory view takes a
+# single query. Responses are encoded as a JSON array of objects.
+SQL_SELECT_MEMORY_WITH_RESPONSES = """
+    SELECT m.id, m.title, m.content, m.media_path, m.created_date,
+        m.unlock_date, m.category, c.name AS category_name, m.mood, m.importance,
+        json_group_array(mt.tag) FILTER (WHERE mt.tag IS NOT NULL) AS tags,
+        (SELECT json_group_array(json_object(
+                'id', r.id, 'response_content', r.response_content,
+                'response_date', r.response_date, 'response_mood', r.response_mood))
+         FROM responses r WHERE r.memory_id = m.id) AS responses
+    FROM memories m
+    LEFT JOIN categories c ON c.id = m.category
+    LEFT JOIN memory_tags mt ON mt.memory_id = m.id
+    WHERE m.id = ?
+    GROUP BY m.id
+"""
+
+SQL_SELECT_RESPONSES = """
+    SELECT id, response_content, response_date, response_mood
+    FROM responses
+    WHERE memory_id = ?
+    ORDER BY response_date DESC
+"""
+
+# Unlock conditions stored for each supported unlock type, encoded once here
+# instead of on every insert. Date unlocks need no extra conditions.
+UNLOCK_CONDITIONS = {
+    unlock_type: json.dumps({"type": unlock_type}) if unlock_type != "date" else None
+    for unlock_type in ("date", "interval", "random")
+}
+
+# Every locked memory with its category name and tags, soonest unlock
+# first. Fills the cache get_locked_memories filters and sorts. Walking
+# idx_memories_locked and looking the category and tags up by primary key
+# returns the rows in order without grouping or sorting them.
+SQL_SELECT_LOCKED = """
+    SELECT m.id, m.title, m.created_date, m.unlock_date,
+            m.category, c.name AS category_name, m.importance, m.mood,
+            (SELECT json_group_array(mt.tag) FROM memory_tags mt
+             WHERE mt.memory_id = m.id) AS tags
+    FROM memories m
+    LEFT JOIN categories c ON c.id = m.category
+    WHERE m.is_unlocked = 0
+    ORDER BY m.unlock_date
+"""
+
+# Fields get_locked_memories can sort by
+LOCKED_SORT_FIELDS = ("unlock_date", "created_date", "importance")
+
+# WHERE clause for each simple key accepted by get_memories_with_filters
+MEMORY_FILTER_CLAUSES = {
+    "is_unlocked": "m.is_unlocked = ?",
+    "unlock_after_date": "m.unlock_date >= ?",
+    "category_id": "m.category = ?"
+}
+
+# Clauses each table's stored definition must contain. Tables created by
+# older versions are missing them and get rebuilt by setup_database.
+SCHEMA_UPGRADE_MARKERS = {
+    "memory_tags": ("WITHOUT ROWID", "ON DELETE CASCADE"),
+    "responses": ("ON DELETE CASCADE",),
+    "categories": ("WITHOUT ROWID",)
+}
+# Default categories as (name, description, icon). Their IDs are derived
+# from the name, so every new database gets the same IDs.
+DEFAULT_CATEGORIES = [
+    ("Milestone", "Important life events and achievements", "trophy"),
+    ("Letter", "Messages to your future self", "envelope"),
+    ("Question", "Questions for your future self to answer", "question-mark"),
+    ("Prediction", "Guesses about your future", "crystal-ball"),
+    ("Gratitude", "Things you're thankful for", "heart")
+]
+
+SQL_SEED_CATEGORIES = ("INSERT OR IGNORE INTO categories (id, name, description, icon) VALUES "
+                       + ", ".join(["(?, ?, ?, ?)"] * len(DEFAULT_CATEGORIES)))
+
+DEFAULT_CATEGORY_VALUES = [value for name, description, icon in DEFAULT_CATEGORIES
+                           for value in (str(uuid.uuid5(uuid.NAMESPACE_DNS, name)), name, description, icon)]
+
+# Number of memories get_memory_by_id keeps around for the memory view
+MEMORY_CACHE_SIZE = 256
+
+# Bytes copied at a time when moving a database file in or out of an archive
+ARCHIVE_CHUNK_SIZE = 2 * 1024 * 1024
+
+# Buffer size of an archive file, so the small compressed blocks zipfile
+# produces reach the disk in few large reads and writes
+ARCHIVE_BUFFER_SIZE = 1024 * 1024
+
+# Pages copied per step by SQLite's online backup (4 MB with 4 KB pages)
+BACKUP_PAGES = 1024
+
+# Compression method and level of the database in an export archive, by
+# name. The fast level takes about half the time of zlib's default level
+# for an archive only a few percent larger.
+EXPORT_COMPRESSION = {
+    "none": (zipfile.ZIP_STORED, None),
+    "fast": (zipfile.ZIP_DEFLATED, 1),
+    "best": (zipfile.ZIP_DEFLATED, 9)
+}
+
+# Merging an imported database, which is attached to the current database
+# as "imp". Only memories whose id isn't here yet are copied, together with
+# their tags and responses. Categories are matched by name, and imported
+# categories with a new name are added with their original id.
+SQL_MERGE_NEW_IDS = """
+    CREATE TEMP TABLE merge_ids AS
+    SELECT id FROM imp.memories
+    WHERE id NOT IN (SELECT id FROM main.memories)
+"""
+
+SQL_MERGE_CATEGORIES = """
+    INSERT OR IGNORE INTO main.categories (id, name, description, icon)
+    SELECT id, name, description, icon FROM imp.categories
+    WHERE name NOT IN (SELECT name FROM main.categories)
+"""
+
+SQL_MERGE_MEMORIES = """
+    INSERT INTO main.memories
+    (id, title, content, media_path, created_date, unlock_date,
+     unlock_type, unlock_conditions, is_unlocked, category, mood, importance)
+    SELECT m.id, m.title, m.content, m.media_path, m.created_date, m.unlock_date,
+           m.unlock_type, m.unlock_conditions, m.is_unlocked,
+           COALESCE(c.id, m.category), m.mood, m.importance
+    FROM imp.memories m
+    LEFT JOIN imp.categories ic ON ic.id = m.category
+    LEFT JOIN main.categories c ON c.name = ic.name
+    WHERE m.id IN (SELECT id FROM temp.merge_ids)
+"""
+
+SQL_MERGE_TAGS = """
+    INSERT INTO main.memory_tags (memory_id, tag)
+    SELECT memory_id, tag FROM imp.memory_tags
+    WHERE memory_id IN (SELECT id FROM temp.merge_ids)
+"""
+
+SQL_MERGE_RESPONSES = """
+    INSERT INTO main.responses (id, memory_id, response_content, response_date, response_mood)
+    SELECT id, memory_id, response_content, response_date, response_mood FROM imp.responses
+    WHERE memory_id IN (SELECT id FROM temp.merge_ids)
+"""
+
+# Star rating text for each importance from 0 to 5
+IMPORTANCE_STARS = tuple("★" * filled + "☆" * (5 - filled) for filled in range(6))
+
+def format_importance(importance):
+    """Return the star rating text for an importance, clamped to 0-5 stars."""
+    return IMPORTANCE_STARS[max(0, min(5, int(importance)))]
+
+def format_display_date(iso_date):
+    """
+    Format a stored ISO date string as e.g. "January 05, 2025".
+
+    Equivalent to datetime.fromisoformat(iso_date).strftime("%B %d, %Y"),
+    but slices the fixed YYYY-MM-DD prefix instead of parsing the string.
+    """
+    return f"{calendar.month_name[int(iso_date[5:7])]} {iso_date[8:10]}, {iso_date[0:4]}"
+
+def clean_tags(tags):
+    """Strip whitespace from tags and drop empty and repeated ones, keeping their order."""
+    return list(dict.fromkeys(tag.strip() for tag in tags if tag and tag.strip()))
+
 class MemoryKeeper:
     """
     Memory Keeper: A digital time capsule application that allows users
     to store memories to be unlocked at future dates.
     """
+    # Set once the application directories have been created in this process
+    _dirs_ready = False
+
     def __init__(self, db_path="memorykeeper.db"):
         """
         Initialize the Memory Keeper application.
         Args:
-                db_path: Path to the SQLite database file
+                db_path: Path to the SQLite database file, or ":memory:" for a
+                         temporary database that is discarded on close
         """
         self.db_path = db_path
+        self.in_memory = db_path == ":memory:"
+        self._conn = None
+        # The connection is shared with worker threads, so writes take this
+        # lock to keep one thread's transaction from interleaving another's
+        self._write_lock = threading.Lock()
+        self._categories_cache = None
+        # Dashboard counts, dropped whenever a write changes them
+        self._counts_cache = None
+        # Locked memories for the vault, dropped on the same writes
+        self._locked_cache = None
+        # Recently viewed memories by (id, include_responses), least
+        # recently used first
+        self._memory_cache = OrderedDict()
         self.app_dir = Path.home() / ".memory_keeper"
         self.media_dir = self.app_dir / "media"
         # Create application directories if they don't exist
-        self.app_dir.mkdir(exist_ok=True)
-        self.media_dir.mkdir(exist_ok=True)
+        if not self.in_memory and not MemoryKeeper._dirs_ready:
+            self.media_dir.mkdir(parents=True, exist_ok=True)
+            MemoryKeeper._dirs_ready = True
         # Initialize database
         self.setup_database()
     
-    def get_db_connection(self):
-        """Establish and return a database connection."""
-        return sqlite3.connect(self.db_path)
-        
     def setup_database(self):
         """Create the database and tables if they don't exist."""
         conn = self.get_db_connection()
         cursor = conn.cursor()
-        # Create memories table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS memories (
-                id TEXT PRIMARY KEY,
-                title TEXT NOT NULL,
-                content TEXT,
-                media_path TEXT,
-                created_date TEXT NOT NULL,
-                unlock_date TEXT NOT NULL,
-                unlock_type TEXT NOT NULL,
-                unlock_conditions TEXT,
-                is_unlocked INTEGER DEFAULT 0,
-                category TEXT,
-                mood TEXT,
-                importance INTEGER DEFAULT 3
-            )
-        ''')
-        # Create memory_tags table for tagging memories
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS memory_tags (
-                memory_id TEXT NOT NULL,
-                tag TEXT NOT NULL,
-                PRIMARY KEY (memory_id, tag),
-                FOREIGN KEY (memory_id) REFERENCES memories(id)
-            )
-        ''')
-        # Create responses table for capturing reactions to unlocked memories
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS responses (
-                id TEXT PRIMARY KEY,
-                memory_id TEXT NOT NULL,
-                response_content TEXT NOT NULL,
-                response_date TEXT NOT NULL,
-                response_mood TEXT,
-                FOREIGN KEY (memory_id) REFERENCES memories (id)
-            )
-        ''')
-        # Create categories table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS categories (
-                id TEXT PRIMARY KEY,
-                name TEXT UNIQUE NOT NULL,
-                description TEXT,
-                icon TEXT
-            )
-        ''')
-        # Add default categories if non exist
-        cursor.execute("SELECT COUNT(*) FROM categories")
-        if cursor.fetchone()[0] == 0:
-            default_categories = [
-                (str(uuid.uuid4()), "Milestone", "Important life events and achievements", "trophy"),
-                (str(uuid.uuid4()), "Letter", "Messages to your future self", "envelope"),
-                (str(uuid.uuid4()), "Question", "Questions for your future self to answer", "question-mark"),
-                (str(uuid.uuid4()), "Prediction", "Guesses about your future", "crystal-ball"),
-                (str(uuid.uuid4()), "Gratitude", "Things you're thankful for", "heart")
-            ]
-            cursor.executemany(
-                "INSERT INTO categories (id, name, description, icon) VALUES (?, ?, ?, ?)",
-                default_categories
-            )
+        # Tables whose definition changed (WITHOUT ROWID storage, cascading
+        # deletes) are upgraded by moving the old table aside and copying its
+        # rows into the new definition in SCHEMA_TABLES.
+        cursor.execute("""
+            SELECT name, sql FROM sqlite_master
+            WHERE type = 'table' AND name IN ('memory_tags', 'responses', 'categories')
+        """)
+        legacy_tables = [name for name, sql in cursor.fetchall()
+                         if any(marker not in sql.upper() for marker in SCHEMA_UPGRADE_MARKERS[name])]
+        # Rows that point at a deleted memory can't satisfy the foreign key
+        copy_filters = {"memory_tags": " WHERE memory_id IN (SELECT id FROM memories)",
+                        "responses": " WHERE memory_id IN (SELECT id FROM memories)"}
+        # Run the whole schema as one script. executescript commits anything
+        # pending before it starts, so the script opens the transaction itself
+        # and the seeding below commits it.
+        cursor.executescript(
+            "BEGIN;"
+            + "".join(f"ALTER TABLE {table} RENAME TO {table}_old;" for table in legacy_tables)
+            + SCHEMA_TABLES
+            + "".join(f"INSERT INTO {table} SELECT * FROM {table}_old{copy_filters.get(table, '')};"
+                      f"DROP TABLE {table}_old;" for table in legacy_tables)
+            + SCHEMA_INDEXES
+        )
+        # Add default categories; the UNIQUE name makes this a no-op once they exist
+        cursor.execute(SQL_SEED_CATEGORIES, DEFAULT_CATEGORY_VALUES)
         conn.commit()
-        conn.close()
+        # Gather planner statistics the first time; PRAGMA optimize keeps them fresh
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+        if cursor.fetchone() is None:
+            cursor.execute("ANALYZE")
         
     def get_db_connection(self):
-        """Establish and return a database connection"""
-        return sqlite3.connect(self.db_path)
+        """Return the shared database connection, opening it on first use."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                         isolation_level=None, cached_statements=256)
+            self._configure_connection(self._conn)
+        return self._conn
+
+    def _configure_connection(self, conn):
+        """Apply the row factory and PRAGMAs, which are per-connection settings."""
+        # Rows are accessible by column name
+        conn.row_factory = sqlite3.Row
+        pragmas = ["PRAGMA synchronous=NORMAL",
+                   "PRAGMA busy_timeout=5000",
+                   "PRAGMA temp_store=MEMORY",
+                   "PRAGMA cache_size=-64000",
+                   "PRAGMA foreign_keys=ON"]
+        if not self.in_memory:
+            # Journaling and memory-mapped I/O only apply to database files.
+            # The mapped size is further capped by SQLite's compile-time limit.
+            pragmas += ["PRAGMA journal_mode=WAL",
+                        "PRAGMA mmap_size=268435456"]  # 256 MB
+        for pragma in pragmas:
+            conn.execute(pragma)
+
+    def optimize(self):
+        """Let SQLite refresh the query planner statistics if they are stale."""
+        self.get_db_connection().execute("PRAGMA optimize")
+
+    def open_snapshot(self):
+        """
+        Open a separate connection holding a consistent view of the database file.
+
+        The write-ahead log is checkpointed into the database file and a read
+        transaction is started before any other write can happen. While that
+        transaction is open, checkpoints can't copy newer pages into the file,
+        so the file itself can be read as a consistent copy while the app keeps
+        writing. Close the connection to release it.
+
+        Returns:
+            The snapshot connection
+        """
+        snapshot = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+        try:
+            with self._write_lock:
+                busy, _, _ = self.get_db_connection().execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+                if busy:
+                    raise sqlite3.OperationalError("database is busy, try again")
+                snapshot.execute("BEGIN")
+                snapshot.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+        except Exception:
+            snapshot.close()
+            raise
+        return snapshot
+
+    def backup_database(self, backup_path):
+        """
+        Copy the database to another file with SQLite's online backup.
+
+        Args:
+            backup_path: Path of the copy, which is overwritten if it exists
+        """
+        backup = sqlite3.connect(backup_path)
+        try:
+            with self._write_lock:
+                self.get_db_connection().backup(backup, pages=BACKUP_PAGES)
+        finally:
+            backup.close()
+
+    def restore_database(self, source_path):
+        """
+        Replace the contents of the database with another database file.
+
+        The pages are copied in through the shared connection, so it stays
+        open and the write-ahead log stays consistent. Nothing changes if
+        the copy fails part way.
+
+        Args:
+            source_path: Path of the database to copy in
+        """
+        source = sqlite3.connect(source_path)
+        try:
+            with self._write_lock:
+                source.backup(self.get_db_connection(), pages=BACKUP_PAGES)
+        finally:
+            source.close()
+        self.clear_cache()
+        # Bring a database from an older version up to the current schema
+        self.setup_database()
+
+    def merge_database(self, import_db_path):
+        """
+        Copy the memories of another database file that aren't in this one.
+
+        The other database is attached to the shared connection so SQLite
+        copies the rows itself, and the merge is a single transaction.
+
+        Args:
+            import_db_path: Path to the database being imported
+
+        Returns:
+            Number of memories imported
+        """
+        with self._write_lock:
+            conn = self.get_db_connection()
+            cursor = conn.cursor()
+            cursor.execute("ATTACH DATABASE ? AS imp", (str(import_db_path),))
+            try:
+                cursor.execute("BEGIN IMMEDIATE")
+                try:
+                    # Note which memories are new before any are copied
+                    cursor.execute(SQL_MERGE_NEW_IDS)
+
+                    cursor.execute(SQL_MERGE_CATEGORIES)
+                    cursor.execute(SQL_MERGE_MEMORIES)
+                    imported_count = cursor.rowcount
+                    cursor.execute(SQL_MERGE_TAGS)
+                    cursor.execute(SQL_MERGE_RESPONSES)
+
+                    cursor.execute("DROP TABLE temp.merge_ids")
+                    cursor.execute("COMMIT")
+                except Exception:
+                    cursor.execute("ROLLBACK")
+                    raise
+            finally:
+                cursor.execute("DETACH DATABASE imp")
+        self.clear_cache()
+        return imported_count
+
+    def close(self):
+        """Close the shared database connection."""
+        if self._conn is not None:
+            self._conn.execute("PRAGMA optimize")
+            self._conn.close()
+            self._conn = None
+        self.clear_cache()
 
     def create_memory(self, title, content, unlock_date, category=None, tags=None,
                     media_path=None, mood=None, importance=3, unlock_type="date"):
@@ -122,80 +559,115 @@ class MemoryKeeper:
             content: Text content of the memory
             unlock_date: When the memory should become available (datetime or str)
             category: Optional category ID
-            tags: Optional list of tags
+            tags: Optional list of tags (blank and repeated tags are skipped)
             media_path: Optional path to the associated media
             mood: Optional mood when creating the memory
             importance: Importance level (1-5)
-            unlock_type: Type of unlock condition ('date', 'interval', 'random', etc.)
+            unlock_type: Type of unlock condition ('date', 'interval' or 'random')
 
         Returns:
             The ID of the newly created memory
         """
-        # Generate a unique ID for the memory
-        memory_id = str(uuid.uuid4())
+        return self.create_memories_bulk([{
+            "title": title, "content": content, "unlock_date": unlock_date,
+            "category": category, "tags": tags, "media_path": media_path,
+            "mood": mood, "importance": importance, "unlock_type": unlock_type
+        }])[0]
+
+    def create_memories_bulk(self, memories):
+        """
+        Create several memories in a single transaction.
 
-        # Ensure unlock_date is a string
-        if isinstance(unlock_date, datetime):
-            unlock_date = unlock_date.isoformat()
+        Args:
+            memories: List of dictionaries whose keys match the arguments of
+                      create_memory (title, content and unlock_date are required)
 
-        # Get the current date and teme
+        Returns:
+            List of the IDs of the newly created memories, in input order
+        """
+        # Get the current date and time once for the whole batch
         created_date = datetime.now().isoformat()
 
-        # Store unlock conditions as JSON if they exist
-        unlock_conditions = None
-        if unlock_type != "date":
-            unlock_conditions = json.dumps({
-                "type": unlock_type,
-            })
-            
-        # Insert the memory into the database
+        memory_ids = []
+        memory_rows = []
+        tag_pairs = []
+        for memory in memories:
+            # Generate a unique ID for the memory
+            memory_id = str(uuid.uuid4())
+
+            # Ensure unlock_date is a string
+            unlock_date = memory["unlock_date"]
+            if isinstance(unlock_date, datetime):
+                unlock_date = unlock_date.isoformat()
+
+            # Look up the pre-encoded unlock conditions for this unlock type
+            unlock_type = memory.get("unlock_type", "date")
+            if unlock_type not in UNLOCK_CONDITIONS:
+                raise ValueError(f"Unknown unlock type: {unlock_type}")
+            unlock_conditions = UNLOCK_CONDITIONS[unlock_type]
+
+            memory_ids.append(memory_id)
+            memory_rows.append((memory_id, memory["title"], memory["content"], memory.get("media_path"),
+                                created_date, unlock_date, unlock_type, unlock_conditions,
+                                memory.get("category"), memory.get("mood"), memory.get("importance", 3)))
+            tag_pairs.extend((memory_id, tag) for tag in clean_tags(memory.get("tags") or []))
+
+        # Insert the memories and their tags in a single transaction. IMMEDIATE
+        # takes the write lock up front instead of upgrading a read lock later.
         conn = self.get_db_connection()
         cursor = conn.cursor()
-        cursor.execute('''
-        INSERT INTO memories
-        (id, title, content, media_path, created_date, unlock_date,
-        unlock_type, unlock_conditions, category, mood, importance)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (memory_id, title, content, media_path, created_date, unlock_date,
-            unlock_type, unlock_conditions, category, mood, importance))
-        
-        # Add tags if provided
-        if tags:
-            for tag in tags:
-                cursor.execute('''
-                    INSERT INTO memory_tags (memory_id, tag) VALUES (?, ?)
-                ''', (memory_id, tag))
-        
-        conn.commit()
-        conn.close()
-        return memory_id
+        with self._write_lock, conn:
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.executemany(SQL_INSERT_MEMORY, memory_rows)
+
+            # Add tags, one statement per batch of tags
+            for start in range(0, len(tag_pairs), MAX_TAGS_PER_INSERT):
+                batch = tag_pairs[start:start + MAX_TAGS_PER_INSERT]
+                cursor.execute(SQL_INSERT_TAGS + ", ".join(["(?, ?)"] * len(batch)),
+                               [value for pair in batch for value in pair])
+
+        # Drop the cached results only once the memories are committed, so a
+        # concurrent read can't fill the caches again from before the commit
+        self._counts_cache = None
+        self._locked_cache = None
+
+        return memory_ids
     
-    def get_upcoming_memories(self, limit = 10):
+    def get_upcoming_memories(self, limit = 10, now = None):
         """
         Get memories that will unlock soon but haven't yet.
 
         Args:
             limit: Maximum number of memories to return
+            now: Current time as an ISO string (defaults to the system clock)
 
         Returns:
-            List of memory dictionaries
+            List of memory rows accessible by column name
         """
         conn = self.get_db_connection()
         cursor = conn.cursor()
 
-        cursor.execute('''
-            SELECT id, title, created_date, unlock_date, category, importance
-            FROM memories
-            WHERE is_unlocked = 0 AND unlock_date > ?
-            ORDER BY unlock_date ASC
-            LIMIT ?
-        ''', (datetime.now().isoformat(), limit))
+        cursor.execute(SQL_SELECT_UPCOMING, (now or datetime.now().isoformat(), limit))
+
+        return cursor.fetchall()
 
-        columns = ["id", "title", "created_date", "unlock_date", "category", "importance"]
-        memories = [dict(zip(columns, row)) for row in cursor.fetchall()]
+    def get_upcoming_memories_for_dashboard(self, limit = 5, now = None):
+        """
+        Get the title and dates of the memories that will unlock next.
+
+        Args:
+            limit: Maximum number of memories to return
+            now: Current time as an ISO string (defaults to the system clock)
 
-        conn.close()
-        return memories
+        Returns:
+            List of rows with title, created_date and unlock_date
+        """
+        conn = self.get_db_connection()
+        cursor = conn.cursor()
+
+        cursor.execute(SQL_SELECT_UPCOMING_DASHBOARD, (now or datetime.now().isoformat(), limit))
+
+        return cursor.fetchall()
     
     def unlock_memory(self, memory_id):
         """
@@ -210,15 +682,14 @@ class MemoryKeeper:
         conn = self.get_db_connection()
         cursor = conn.cursor()
 
-        cursor.execute('''
-            UPDATE memories
-            SET is_unlocked = 1
-            WHERE id = ?
-        ''', (memory_id,))
+        with self._write_lock:
+            cursor.execute(SQL_UNLOCK_MEMORY, (memory_id,))
+            success = cursor.rowcount > 0
 
-        success = cursor.rowcount > 0
-        conn.commit()
-        conn.close()
+        # Drop the cached results once the change is committed
+        self._counts_cache = None
+        self._locked_cache = None
+        self._forget_memory(memory_id)
 
         return success
     
@@ -240,77 +711,93 @@ class MemoryKeeper:
         conn = self.get_db_connection()
         cursor = conn.cursor()
 
-        cursor.execute('''
-            INSERT INTO responses
-            (id, memory_id, response_content, response_date, response_mood)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (response_id, memory_id, response_content, response_date, mood))
+        with self._write_lock:
+            cursor.execute(SQL_INSERT_RESPONSE, (response_id, memory_id, response_content, response_date, mood))
 
-        conn.commit()
-        conn.close()
+        # Drop the cached memory once the response is committed
+        self._forget_memory(memory_id)
 
         return response_id
     
     def get_memory_count(self):
         """Get counts of total, locked, and unlocked memories."""
-        conn = self.get_db_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT COUNT(*) FROM memories")
-        total_count = cursor.fetchone()[0]
-
-        cursor.execute("SELECT COUNT(*) FROM memories WHERE is_unlocked = 0")
-        locked_count = cursor.fetchone()[0]
-
-        cursor.execute("SELECT COUNT(*) FROM memories WHERE is_unlocked = 1")
-        unlocked_count = cursor.fetchone()[0]
-
-        conn.close()
-
-        return {
-            "total": total_count,
-            "locked": locked_count,
-            "unlocked": unlocked_count
-        }
+        # The counts only change through this instance's writes, which clear
+        # the cache, so repeated dashboard refreshes don't re-run the query.
+        # Another thread's write can drop the cache at any time, so it is
+        # only read once.
+        counts = self._counts_cache
+        if counts is None:
+            conn = self.get_db_connection()
+            cursor = conn.cursor()
+
+            # Count all three buckets in a single scan
+            cursor.execute(SQL_COUNT_MEMORIES)
+            total_count, locked_count, unlocked_count = cursor.fetchone()
+
+            counts = {
+                "total": total_count,
+                "locked": locked_count,
+                "unlocked": unlocked_count
+            }
+            self._counts_cache = counts
+
+        return dict(counts)
 
     def get_categories(self):
         """Get all available categories."""
-        conn = self.get_db_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT id, name, description, icon FROM categories")
-
-        columns = ["id", "name", "description", "icon"]
-        categories = [dict(zip(columns, row)) for row in cursor.fetchall()]
-
-        conn.close()
-        return categories
+        # Categories almost never change, so serve them from memory
+        if self._categories_cache is None:
+            conn = self.get_db_connection()
+            cursor = conn.cursor()
+
+            cursor.execute(SQL_SELECT_CATEGORIES)
+            self._categories_cache = cursor.fetchall()
+
+        return self._categories_cache
+
+    def clear_cache(self):
+        """Forget cached query results after the database changed outside this instance."""
+        self._categories_cache = None
+        self._counts_cache = None
+        self._locked_cache = None
+        self._memory_cache.clear()
+
+    def _forget_memory(self, memory_id):
+        """Drop a memory that was just changed from the get_memory_by_id cache."""
+        self._memory_cache.pop((memory_id, False), None)
+        self._memory_cache.pop((memory_id, True), None)
     
-    def get_unlockable_memories(self):
+    def get_unlockable_memories(self, now = None):
         """
         Get memories that are ready to be unlocked based on their unlock date.
-        
+
+        Args:
+            now: Current time as an ISO string (defaults to the system clock)
+
         Returns:
-            List of memory dictionaries
+            List of memory rows accessible by column name
         """
         conn = self.get_db_connection()
         cursor = conn.cursor()
+
+        cursor.execute(SQL_SELECT_UNLOCKABLE, (now or datetime.now().isoformat(),))
         
-        now = datetime.now().isoformat()
-        cursor.execute('''
-            SELECT id, title, content, media_path, created_date, unlock_date, 
-                category, mood, importance
-            FROM memories
-            WHERE is_unlocked = 0 AND unlock_date <= ?
-        ''', (now,))
-        
-        columns = ["id", "title", "content", "media_path", "created_date", 
-                "unlock_date", "category", "mood", "importance"]
-        memories = [dict(zip(columns, row)) for row in cursor.fetchall()]
-        
-        conn.close()
-        return memories
+        return cursor.fetchall()
     
+    def has_unlockable_memories(self, now = None):
+        """
+        Check whether any locked memory has reached its unlock date.
+
+        Args:
+            now: Current time as an ISO string (defaults to the system clock)
+        """
+        conn = self.get_db_connection()
+        cursor = conn.cursor()
+
+        cursor.execute(SQL_UNLOCKABLE_EXISTS, (now or datetime.now().isoformat(),))
+
+        return bool(cursor.fetchone()[0])
+
     def get_locked_memories(self, category_id = None, sort_field = "unlock_date", 
                             sort_order = "ASC", search_text = "", limit = 50):
         """
@@ -318,70 +805,65 @@ class MemoryKeeper:
 
         Args:
             category_id: Filter by category ID (None for all categories)
-            sort_field: Field to sort by (unlock_date, created_date, importance)
+            sort_field: Field to sort by (unlock_date, created_date, importance);
+                        anything else sorts by unlock_date
             sort_order: Sort direction (ASC or DESC)
             search_text: Filter by title or tags containing this text
-            limit: Maximum number of memories to return
+            limit: Maximum number of memories to return (None for no limit)
 
         Returns:
-            List of memory dictionaries
-        """
-        conn = self.get_db_connection()
-        conn.row_factory = sqlite3.Row # This makes the rows accessible by column name
-        cursor = conn.cursor()
-
-        # Start building the query
-        query = """
-            SELECT m.id, m.title, m.created_date, m.unlock_date,
-                    m.category, m.importance, m.mood, GROUP_CONCAT(mt.tag) as tags
-            FROM memories m
-            LEFT JOIN memory_tags mt ON m.id = mt.memory_id
-            WHERE m.is_unlocked = 0
+            List of memory dictionaries, each with its unlock date also
+            parsed into a datetime under "unlock_datetime"
         """
+        # Load every locked memory once and answer filter, sort and search
+        # changes from memory until a write drops the cache. Each entry keeps
+        # the lowercased title and tags to match the search against. The
+        # cache maps (sort_field, descending) to the entries in that order,
+        # starting with the unlock date order the query returns. A write on
+        # another thread can drop the cache at any time, so it is only read
+        # through this local.
+        cache = self._locked_cache
+        if cache is None:
+            conn = self.get_db_connection()
+            cursor = conn.cursor()
+            cursor.execute(SQL_SELECT_LOCKED)
+
+            locked = []
+            for row in cursor.fetchall():
+                memory = dict(row)
+                # Tags arrive as a JSON array, empty when the memory has none
+                memory["tags"] = json.loads(memory["tags"])
+                # Parsed once here rather than on every vault refresh
+                memory["unlock_datetime"] = datetime.fromisoformat(memory["unlock_date"])
+                search_keys = [memory["title"].lower()] + [tag.lower() for tag in memory["tags"]]
+                locked.append((memory, search_keys))
+            cache = {("unlock_date", False): locked}
+            self._locked_cache = cache
+
+        # Pick the order, falling back to soonest unlock for unknown values.
+        # Other orders are sorted once per cache and kept, so changing the
+        # search or category never sorts again. NULLs sort first ascending
+        # like they do in SQLite.
+        if sort_field not in LOCKED_SORT_FIELDS:
+            sort_field, sort_order = "unlock_date", "ASC"
+        order = (sort_field, str(sort_order).upper() == "DESC")
+        entries = cache.get(order)
+        if entries is None:
+            entries = sorted(cache[("unlock_date", False)],
+                             key = lambda entry: (entry[0][sort_field] is not None, entry[0][sort_field]),
+                             reverse = order[1])
+            cache[order] = entries
+
+        # Filtering keeps the order, so stop as soon as enough memories match
+        search_text = search_text.lower()
+        matches = (
+            memory for memory, search_keys in entries
+            if (not category_id or memory["category"] == category_id)
+            and (not search_text or any(search_text in key for key in search_keys))
+        )
 
-        # Parameters for the query
-        params = []
-
-        # Add category filter if specified
-        if category_id:
-            query += " AND m.category = ?"
-            params.append(category_id)
-        
-        # Add searc filter if specified
-        if search_text:
-            query += """ AND (
-                LOWER(m.title) LIKE ?
-                OR EXISTS (
-                    SELECT 1 FROM memory_tags
-                    WHERE memory_id = m.id AND LOWER(tag) LIKE?
-                )
-            )"""
-            search_param = f"%{search_text}%"
-            params.extend([search_param, search_param])
-
-        # Group by memory ID to combine tags
-        query += " GROUP by m.id"
-
-        # Add sorting
-        query += f" ORDER by m.{sort_field} {sort_order}"
-
-        #Add limit
-        query += " LIMIT ?"
-        params.append(limit)
-
-        cursor.execute(query, params)
-
-        #Convert to list of dictionaries
-        memories = []
-        for row in cursor.fetchall():
-            memory = dict(row)
-            # Convert tags from comma-separated string to list if not None
-            if memory.get("tags"):
-                memory["tags"] = memory["tags"].split(",")
-            memories.append(memory)
-        
-        conn.close()
-        return memories
+        # Hand out copies so callers can't change the cached memories
+        return [dict(memory, tags = list(memory["tags"])) for memory in itertools.islice(matches, limit)]
     
     def get_memories_with_filters(self, filters):
         """
@@ -390,15 +872,14 @@ class MemoryKeeper:
         Args:
             filters: Dictionary of filter parameters
             - is_unlocked: 1 for unlocked, 0 for locked
-            - unlock_after date: Only memories unlocked after this date
+            - unlock_after_date: Only memories unlocked after this date
             - category_id: Filter by category
             - has_responses: True/False for memories with/without responses
 
         Returns:
-            List of memory dictionaries
+            List of memory rows accessible by column name
         """
         conn = self.get_db_connection()
-        conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
         # Start building the query
@@ -408,91 +889,77 @@ class MemoryKeeper:
             FROM memories m
         """
 
-        # Join with responses table if needed
-        if filters.get("has_responses") is not None:
-            query += " LEFT JOIN responses r ON m.id = r.memory_id"
-
-        # Where clause
-        query += " WHERE 1 = 1" # Start with a true condition
-
-        # Parameters for the query
-        params = []
+        # Apply the filters that were given, in a fixed order
+        filter_keys = [key for key in MEMORY_FILTER_CLAUSES if key in filters]
+        conditions = [MEMORY_FILTER_CLAUSES[key] for key in filter_keys]
+        params = [filters[key] for key in filter_keys]
 
-        # Apply filters
-        if "is_unlocked" in filters:
-            query += " AND m.is_unlocked = ?"
-            params.append(filters["is_unlocked"])
-
-        if "unlocked_after_date" in filters:
-            query += " AND m.unlock_date >= ?"
-            params.append(filters["unlock_after_date"])
-
-        if "category_id" in filters:
-            query += " AND m.category = ?"
-            params.append(filters["category_id"])
-
-        if "has_responses" in filters:
-            if filters["has_responses"]:
-                query += " AND r.id IS NOT NULL"
-            else:
-                query += " AND r.id IS NULL"
+        # Probe the responses index instead of joining, so each memory
+        # appears once without grouping and the rows keep the index order
+        has_responses = filters.get("has_responses")
+        if has_responses is not None:
+            exists = "EXISTS (SELECT 1 FROM responses r WHERE r.memory_id = m.id)"
+            conditions.append(exists if has_responses else "NOT " + exists)
 
-        # Group by memory id to avoid duplicates from the join
-        query += " GROUP BY m.id"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
 
         # Order by unlock date (most recent first)
         query += " ORDER BY m.unlock_date DESC"
 
         cursor.execute(query, params)
 
-        # Convert to list of dictionaries
-        memories = [dict(row) for row in cursor.fetchall()]
-
-        conn.close()
-        return memories
+        return cursor.fetchall()
     
-    def get_memory_by_id(self, memory_id):
+    def get_memory_by_id(self, memory_id, include_responses = False):
         """
         Get a single memory by its ID.
 
         Args:
             memory_id: The unique ID of the memory
+            include_responses: Also fetch the memory's responses, newest first,
+                               under "responses" in the same query
 
         Returns:
             Memory dictionary or None if not found
         """
+        # Serve memories viewed recently from the cache. Writes through this
+        # instance drop the memories they change.
+        key = (memory_id, include_responses)
+        memory = self._memory_cache.get(key)
+        if memory is not None:
+            self._memory_cache.move_to_end(key)
+            return copy.deepcopy(memory)
+
         conn = self.get_db_connection()
-        conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
-        # Get the memory
-        cursor.execute("""
-            SELECT m.id, m.title, m.content, m.media_path, m.created_date,
-                m.unlock_date, m.category, m.mood, m.importance
-            FROM memories m
-            WHERE m.id = ? 
-        """, (memory_id,))
+        # Get the memory and its tags
+        cursor.execute(SQL_SELECT_MEMORY_WITH_RESPONSES if include_responses else SQL_SELECT_MEMORY,
+                       (memory_id,))
 
         row = cursor.fetchone()
 
         if not row:
-            conn.close()
             return None
         
         memory = dict(row)
 
-        # Get tags for this memory
-        cursor.execute("""
-            SELECT tag FROM memory_tags
-            WHERE memory_id = ?
-        """, (memory_id,))
-
-        tags = [row[0] for row in cursor.fetchall()]
+        # Only include the tags when there are some
+        tags = json.loads(memory.pop("tags"))
         if tags:
             memory["tags"] = tags
 
-        conn.close()
-        return memory
+        if include_responses:
+            memory["responses"] = sorted(json.loads(memory["responses"]),
+                                         key = lambda response: response["response_date"], reverse = True)
+
+        self._memory_cache[key] = memory
+        if len(self._memory_cache) > MEMORY_CACHE_SIZE:
+            self._memory_cache.popitem(last = False)
+
+        # Hand out a copy so callers can't change the cached memory
+        return copy.deepcopy(memory)
     
     def get_responses_for_memory(self, memory_id):
         """
@@ -502,23 +969,14 @@ class MemoryKeeper:
             memory_id: The unique ID of the memory
 
         Returns:
-            List of response dictionaries
+            List of response rows accessible by column name
         """
         conn = self.get_db_connection()
-        conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
-        cursor.execute("""
-            SELECT id, response_content, response_date, response_mood
-            FROM responses
-            WHERE memory_id = ?
-            ORDER BY response_date DESC
-        """, (memory_id,))
-
-        responses = [dict(row) for row in cursor.fetchall()]
+        cursor.execute(SQL_SELECT_RESPONSES, (memory_id,))
 
-        conn.close()
-        return responses
+        return cursor.fetchall()
     
     def delete_memory(self, memory_id):
         """
@@ -534,35 +992,439 @@ class MemoryKeeper:
         conn = self.get_db_connection()
         cursor = conn.cursor()
 
-        try:
-            # Start a transaction
-            conn.execute("BEGIN TRANSACTION")
+        with self._write_lock:
+            try:
+                # A single statement is atomic, cascades included
+                cursor.execute(SQL_DELETE_MEMORY, (memory_id,))
+            except sqlite3.Error as e:
+                print(f"Error deleting memory: {e}")
+                return False
 
-            # Delete associated responses
-            cursor.execute("DELETE FROM responses WHERE memory_id = ?", (memory_id,))
+            success = cursor.rowcount > 0
 
-            # Delete associated tags
-            cursor.execute("DELETE FROM memory_tags WHERE memory_id = ?", (memory_id,))
+        # Drop the cached results once the change is committed
+        self._counts_cache = None
+        self._locked_cache = None
+        self._forget_memory(memory_id)
 
-            # Delete the memory itself
-            cursor.execute("DELETE FROM memories WHERE id = ?", (memory_id,))
+        return success
 
-            # Check if any rows were affected
-            success = cursor.rowcount > 0
+class VaultMemoryModel(QAbstractListModel):
+    """
+    List model holding the locked memories shown in the vault.
 
-            # Commit the transaction
-            conn.commit()
+    The model holds every matching memory but only exposes them a page at a
+    time. The view asks for the next page through fetchMore when it is
+    scrolled to the bottom, so card text is only worked out for memories
+    that can actually be seen.
+    """
 
-            return success
-        
+    PAGE_SIZE = 50
+
+    def __init__(self, parent = None):
+        """
+        Initialize the model.
+
+        Args:
+            parent: Optional parent QObject
+        """
+        super().__init__(parent)
+        self.all_memories = []
+        self.memories = []
+        self.now = datetime.now()
+
+    def set_memories(self, memories):
+        """
+        Replace the memories and show the first page of them.
+
+        Args:
+            memories: List of locked memory dictionaries, in display order
+        """
+        self.beginResetModel()
+        self.all_memories = memories
+        self.now = datetime.now()
+        self.memories = self.prepare_page(0)
+        self.endResetModel()
+
+    def prepare_page(self, start):
+        """
+        Work out the text each card shows for one page of memories.
+
+        Args:
+            start: Index of the first memory of the page
+
+        Returns:
+            List of the page's memory dictionaries
+        """
+        page = self.all_memories[start:start + self.PAGE_SIZE]
+        for memory in page:
+            memory["days_until"] = (memory["unlock_datetime"] - self.now).days
+            memory["created_text"] = f"Created: {format_display_date(memory['created_date'])}"
+            memory["unlock_text"] = f"Unlocks: {format_display_date(memory['unlock_date'])}"
+            memory["category_text"] = f"Category: {memory['category_name'] or 'Uncategorized'}"
+        return page
+
+    def canFetchMore(self, parent):
+        """Return whether some matching memories are not shown yet."""
+        return not parent.isValid() and len(self.memories) < len(self.all_memories)
+
+    def fetchMore(self, parent):
+        """Show the next page of memories."""
+        if parent.isValid():
+            return
+
+        start = len(self.memories)
+        page = self.prepare_page(start)
+        if page:
+            self.beginInsertRows(QModelIndex(), start, start + len(page) - 1)
+            self.memories.extend(page)
+            self.endInsertRows()
+
+    def rowCount(self, parent = QModelIndex()):
+        """Return the number of memories in the model."""
+        return 0 if parent.isValid() else len(self.memories)
+
+    def data(self, index, role = Qt.DisplayRole):
+        """Return the title for display, or the whole memory dictionary for Qt.UserRole."""
+        if not index.isValid():
+            return None
+
+        memory = self.memories[index.row()]
+        if role == Qt.DisplayRole:
+            return memory["title"]
+        if role == Qt.UserRole:
+            return memory
+        return None
+
+class VaultMemoryDelegate(QStyledItemDelegate):
+    """Paints a locked memory as a card, including its Unlock Now and Delete buttons."""
+
+    unlock_clicked = pyqtSignal(str)
+    delete_clicked = pyqtSignal(str)
+
+    CARD_MARGIN = 5
+    PADDING = 10
+    SPACING = 4
+
+    BORDER_COLOR = QColor("#CCCCCC")
+    BACKGROUND_COLOR = QColor("#F8F8F8")
+    UNLOCK_BUTTON_COLOR = QColor("#E0FFE0")
+    DELETE_BUTTON_COLOR = QColor("#FFE0E0")
+    COUNTDOWN_COLOR = QColor("#2C6694")
+    STARS_COLOR = QColor("gold")
+    TAGS_COLOR = QColor("#666666")
+
+    def __init__(self, parent = None):
+        super().__init__(parent)
+        self.title_font = QFont("Arial", 12, QFont.Bold)
+        self.title_metrics = QFontMetrics(self.title_font)
+        self.title_height = self.title_metrics.height()
+        # Bold and italic versions of the view's font, by font key
+        self.font_variants = {}
+        # Pre-rendered star ratings and unlock badge, by text, font, colour
+        # and device pixel ratio
+        self.badge_pixmaps = {}
+
+    def variant_fonts(self, font):
+        """
+        Get the bold and italic versions of a font, building them only once.
+
+        Args:
+            font: Font the view draws its items with
+
+        Returns:
+            Tuple of the bold font and the italic font
+        """
+        key = font.key()
+        if key not in self.font_variants:
+            bold_font = QFont(font)
+            bold_font.setBold(True)
+            italic_font = QFont(font)
+            italic_font.setItalic(True)
+            self.font_variants[key] = (bold_font, italic_font)
+        return self.font_variants[key]
+
+    def badge_pixmap(self, text, font, color, pixel_ratio):
+        """
+        Get a piece of text rendered once into a transparent pixmap.
+
+        Only used for text with a handful of possible values, like the star
+        ratings, so painting a card copies pixels instead of laying out text.
+
+        Args:
+            text: Text to render
+            font: Font to render it in
+            color: Colour of the text
+            pixel_ratio: Device pixel ratio of the view, for sharp high DPI output
+
+        Returns:
+            QPixmap holding the rendered text
+        """
+        key = (text, font.key(), color.rgba(), pixel_ratio)
+        pixmap = self.badge_pixmaps.get(key)
+        if pixmap is None:
+            metrics = QFontMetrics(font)
+            width, height = metrics.horizontalAdvance(text), metrics.height()
+            pixmap = QPixmap(round(width * pixel_ratio), round(height * pixel_ratio))
+            pixmap.setDevicePixelRatio(pixel_ratio)
+            pixmap.fill(Qt.transparent)
+
+            pixmap_painter = QPainter(pixmap)
+            pixmap_painter.setFont(font)
+            pixmap_painter.setPen(color)
+            pixmap_painter.drawText(QRect(0, 0, width, height), Qt.AlignLeft | Qt.AlignVCenter, text)
+            pixmap_painter.end()
+
+            self.badge_pixmaps[key] = pixmap
+        return pixmap
+
+    def header_height(self, option):
+        """Height of the title row, which also holds the buttons."""
+        return max(self.title_height, option.fontMetrics.height() + 10)
+
+    def button_rects(self, option, memory):
+        """
+        Lay out the buttons in the top right corner of a card.
+
+        Args:
+            option: Style option holding the card's rectangle and font
+            memory: Memory dictionary of the card
+
+        Returns:
+            List of (label, rect, signal) tuples, from left to right
+        """
+        buttons = [("Delete", self.delete_clicked)]
+        if memory["days_until"] <= 0:
+            buttons.insert(0, ("Unlock Now", self.unlock_clicked))
+
+        inset = self.CARD_MARGIN + self.PADDING
+        right = option.rect.right() - inset
+        top = option.rect.top() + inset
+        rects = []
+        for label, signal in reversed(buttons):
+            width = option.fontMetrics.horizontalAdvance(label) + 20
+            rects.insert(0, (label, QRect(right - width + 1, top, width, self.header_height(option)), signal))
+            right -= width + self.SPACING
+        return rects
+
+    def paint(self, painter, option, index):
+        """Draw the card frame, buttons, title, dates, stars and tags."""
+        memory = index.data(Qt.UserRole)
+        style = option.widget.style() if option.widget else QApplication.style()
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Card frame
+        card = option.rect.adjusted(self.CARD_MARGIN, self.CARD_MARGIN, -self.CARD_MARGIN, -self.CARD_MARGIN)
+        painter.setPen(self.BORDER_COLOR)
+        painter.setBrush(self.BACKGROUND_COLOR)
+        painter.drawRoundedRect(card, 8, 8)
+        content = card.adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+
+        # Buttons, tinted green for unlock and red for delete
+        buttons = self.button_rects(option, memory)
+        for label, rect, _ in buttons:
+            button = QStyleOptionButton()
+            button.rect = rect
+            button.text = label
+            button.state = QStyle.State_Enabled | QStyle.State_Raised
+            button.palette = QPalette(option.palette)
+            button.palette.setColor(QPalette.Button,
+                                    self.UNLOCK_BUTTON_COLOR if label == "Unlock Now" else self.DELETE_BUTTON_COLOR)
+            style.drawControl(QStyle.CE_PushButton, button, painter, option.widget)
+
+        # Title, elided so it never runs under the buttons
+        header_height = self.header_height(option)
+        title_rect = QRect(content.left(), content.top(),
+                           buttons[0][1].left() - self.SPACING - content.left(), header_height)
+        painter.setFont(self.title_font)
+        painter.setPen(option.palette.text().color())
+        title = self.title_metrics.elidedText(memory["title"], Qt.ElideRight, title_rect.width())
+        painter.drawText(title_rect, Qt.AlignLeft | Qt.AlignVCenter, title)
+
+        # Dates on the left, countdown and category on the right
+        line_height = option.fontMetrics.height()
+        y = content.top() + header_height + self.SPACING
+        painter.setFont(option.font)
+        painter.drawText(QRect(content.left(), y, content.width(), line_height), Qt.AlignLeft, memory["created_text"])
+        painter.drawText(QRect(content.left(), y + line_height, content.width(), line_height), Qt.AlignLeft,
+                         memory["unlock_text"])
+        painter.drawText(QRect(content.left(), y + line_height, content.width(), line_height), Qt.AlignRight,
+                         memory["category_text"])
+
+        bold_font, italic_font = self.variant_fonts(option.font)
+        pixel_ratio = option.widget.devicePixelRatioF() if option.widget else 1.0
+        days_until = memory["days_until"]
+        if days_until > 0:
+            painter.setFont(bold_font)
+            painter.setPen(self.COUNTDOWN_COLOR)
+            painter.drawText(QRect(content.left(), y, content.width(), line_height), Qt.AlignRight,
+                             f"{days_until} days remaining")
+        else:
+            badge = self.badge_pixmap("Ready to unlock now!", bold_font, self.COUNTDOWN_COLOR, pixel_ratio)
+            painter.drawPixmap(content.right() + 1 - round(badge.width() / pixel_ratio), y, badge)
+        y += 2 * line_height + self.SPACING
+
+        # Importance stars
+        if memory["importance"]:
+            stars = self.badge_pixmap(format_importance(memory["importance"]), option.font,
+                                      self.STARS_COLOR, pixel_ratio)
+            painter.drawPixmap(content.left(), y, stars)
+        y += line_height
+
+        # Tags
+        if memory["tags"]:
+            painter.setFont(italic_font)
+            painter.setPen(self.TAGS_COLOR)
+            tags_text = option.fontMetrics.elidedText(f"Tags: {', '.join(memory['tags'])}", Qt.ElideRight,
+                                                      content.width())
+            painter.drawText(QRect(content.left(), y, content.width(), line_height), Qt.AlignLeft, tags_text)
+
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        """Every card has room for the title row, two info lines, stars and tags."""
+        height = (self.header_height(option) + self.SPACING + 4 * option.fontMetrics.height()
+                  + self.SPACING + 2 * (self.PADDING + self.CARD_MARGIN))
+        return QSize(option.rect.width(), height)
+
+    def editorEvent(self, event, model, option, index):
+        """Emit the matching signal when one of the card's buttons is clicked."""
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            memory = index.data(Qt.UserRole)
+            for _, rect, signal in self.button_rects(option, memory):
+                if rect.contains(event.pos()):
+                    signal.emit(memory["id"])
+                    return True
+        return super().editorEvent(event, model, option, index)
+
+# Vault sort choices, in menu order, and the (sort_field, sort_order)
+# each one passes to get_locked_memories
+VAULT_SORT_OPTIONS = {
+    "Unlock Date (Soonest)": ("unlock_date", "ASC"),
+    "Unlock Date (Latest)": ("unlock_date", "DESC"),
+    "Creation Date (Newest)": ("created_date", "DESC"),
+    "Creation Date (Oldest)": ("created_date", "ASC"),
+    "Importance (Highest)": ("importance", "DESC"),
+    "Importance (Lowest)": ("importance", "ASC")
+}
+
+class WorkerSignals(QObject):
+    """Signals a Worker uses to report back to the GUI thread."""
+    result = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+class Worker(QRunnable):
+    """Run a function on the Qt thread pool and emit its result."""
+
+    def __init__(self, fn, *args, **kwargs):
+        """
+        Initialize the worker.
+
+        Args:
+            fn: Function to run on the worker thread
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+        """
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """Call the function and emit its result or error message."""
+        try:
+            result = self.fn(*self.args, **self.kwargs)
         except Exception as e:
-            # If anything goes wrong, roll back the transaction
-            conn.rollback()
-            print(f"Error deleting memory: {e}")
-            return False
-        
-        finally:
-            conn.close()
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.result.emit(result)
+
+class UpcomingMemoriesModel(QAbstractListModel):
+    """List model holding the memories that will unlock next."""
+
+    def __init__(self, memory_keeper, limit = 5, parent = None):
+        """
+        Initialize the model.
+
+        Args:
+            memory_keeper: Reference to the MemoryKeeper instance
+            limit: Maximum number of memories to show
+            parent: Optional parent QObject
+        """
+        super().__init__(parent)
+        self.memory_keeper = memory_keeper
+        self.limit = limit
+        self.memories = []
+
+    def reload(self):
+        """Re-run the upcoming memories query and reset the model."""
+        self.beginResetModel()
+        self.memories = self.memory_keeper.get_upcoming_memories_for_dashboard(limit = self.limit)
+        self.endResetModel()
+
+    def rowCount(self, parent = QModelIndex()):
+        """Return the number of memories in the model."""
+        return 0 if parent.isValid() else len(self.memories)
+
+    def data(self, index, role = Qt.DisplayRole):
+        """Return the title for display, or the whole memory row for Qt.UserRole."""
+        if not index.isValid():
+            return None
+
+        memory = self.memories[index.row()]
+        if role == Qt.DisplayRole:
+            return memory["title"]
+        if role == Qt.UserRole:
+            return memory
+        return None
+
+class UpcomingMemoryDelegate(QStyledItemDelegate):
+    """Paints an upcoming memory as a bold title above its dates."""
+
+    MARGIN = 6
+
+    def __init__(self, parent = None):
+        super().__init__(parent)
+        self.title_font = QFont("Arial", 11, QFont.Bold)
+        self.title_height = QFontMetrics(self.title_font).height()
+
+    def paint(self, painter, option, index):
+        """Draw the item background, title and dates."""
+        memory = index.data(Qt.UserRole)
+
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        style = opt.widget.style() if opt.widget else QApplication.style()
+
+        painter.save()
+
+        # Background and a separator line between entries
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, opt, painter, opt.widget)
+        painter.setPen(opt.palette.mid().color())
+        painter.drawLine(opt.rect.bottomLeft(), opt.rect.bottomRight())
+
+        # Title and dates
+        painter.setPen(opt.palette.text().color())
+        rect = opt.rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        title_rect = rect.adjusted(0, 0, 0, self.title_height - rect.height())
+        painter.setFont(self.title_font)
+        painter.drawText(title_rect, Qt.AlignLeft | Qt.AlignVCenter, memory["title"])
+
+        created = format_display_date(memory["created_date"])
+        unlock = format_display_date(memory["unlock_date"])
+        painter.setFont(opt.font)
+        painter.drawText(rect.adjusted(0, self.title_height, 0, 0), Qt.AlignLeft | Qt.AlignTop,
+                         f"Created: {created} | Unlocks: {unlock}")
+
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        """Every entry is one title line plus one line of dates."""
+        height = self.title_height + option.fontMetrics.height() + 2 * self.MARGIN
+        return QSize(option.rect.width(), height)
 
 class MemoryKeeperApp(QMainWindow):
     """Main application window for MemoryKeeper."""
@@ -571,8 +1433,34 @@ class MemoryKeeperApp(QMainWindow):
         super().__init__()
 
         self.memory_keeper = memory_keeper
+
+        # Writes go through a single background thread so commits never block
+        # the UI, while still reaching SQLite one at a time
+        self.writer_pool = QThreadPool(self)
+        self.writer_pool.setMaxThreadCount(1)
+
+        # Dialogs that are shown again and again are built on first use and
+        # then reused, instead of being constructed for every message
+        self.delete_confirm_box = None
+        self.unlocked_notice_box = None
+        self.import_choice_box = None
+
+        # Set while an import rewrites the database on the writer thread.
+        # Refreshes meanwhile only mark their tab stale.
+        self.import_running = False
+
         self.init_ui()
 
+        # Keep the query planner statistics fresh while the app stays open
+        self.optimize_timer = QTimer(self)
+        self.optimize_timer.timeout.connect(self.memory_keeper.optimize)
+        self.optimize_timer.start(15 * 60 * 1000)  # Every 15 minutes
+
+        # Keep checking for memories that become unlockable while the app is open
+        self.unlock_timer = QTimer(self)
+        self.unlock_timer.timeout.connect(self.check_unlockable_memories)
+        self.unlock_timer.start(60 * 1000)  # Every minute
+
     def init_ui(self):
         """Initialize the user interface."""
         self.setWindowTitle("MemoryKeeper - Your Digital Time Capsule")
@@ -593,6 +1481,12 @@ class MemoryKeeperApp(QMainWindow):
         self.tabs = QTabWidget()
         main_layout.addWidget(self.tabs)
 
+        # The dashboard, vault and unlocked tabs only query their memories
+        # while they are the current tab. A refresh requested while one is
+        # hidden marks it stale instead, and it reloads when it is next
+        # shown. The vault and unlocked tabs start out stale.
+        self.stale_tabs = {"vault", "unlocked"}
+
         # Create individual tabs
         self.dashboard_tab = self.create_dashboard_tab()
         self.create_memory_tab = self.create_memory_form_tab()
@@ -604,8 +1498,10 @@ class MemoryKeeperApp(QMainWindow):
         self.tabs.addTab(self.create_memory_tab, "Create Memory")
         self.tabs.addTab(self.vault_tab, "Memory Vault")
         self.tabs.addTab(self.unlocked_tab, "Unlocked Memories")
+        self.tabs.currentChanged.connect(self.load_stale_tab)
 
         # Check for unlockable memories
+        self.unlock_check_running = False
         self.check_unlockable_memories()
 
         # Footer with status information
@@ -635,21 +1531,19 @@ class MemoryKeeperApp(QMainWindow):
         stats_group = QGroupBox("Your Memory Stats")
         stats_layout = QHBoxLayout(stats_group)
 
-        # Get memory counts
-        counts = self.memory_keeper.get_memory_count()
-
-        total_label = QLabel(f"Total Memories: {counts['total']}")
-        total_label.setFont(QFont("Arial", 12))
+        # Labels are kept so refresh_dashboard can update them in place
+        self.total_label = QLabel()
+        self.total_label.setFont(QFont("Arial", 12))
 
-        locked_label = QLabel(f"Locked:  {counts['locked']}")
-        locked_label.setFont(QFont("Arial", 12))
+        self.locked_label = QLabel()
+        self.locked_label.setFont(QFont("Arial", 12))
 
-        unlocked_label = QLabel(f"Unlocked: {counts['unlocked']}")
-        unlocked_label.setFont(QFont("Arial", 12))
+        self.unlocked_label = QLabel()
+        self.unlocked_label.setFont(QFont("Arial", 12))
 
-        stats_layout.addWidget(total_label)
-        stats_layout.addWidget(locked_label)
-        stats_layout.addWidget(unlocked_label)
+        stats_layout.addWidget(self.total_label)
+        stats_layout.addWidget(self.locked_label)
+        stats_layout.addWidget(self.unlocked_label)
 
         layout.addWidget(stats_group)
 
@@ -657,35 +1551,27 @@ class MemoryKeeperApp(QMainWindow):
         upcoming_group = QGroupBox("Upcoming Memories")
         upcoming_layout = QVBoxLayout(upcoming_group)
 
-        # Get upcoming memories
-        upcoming_memories = self.memory_keeper.get_upcoming_memories(limit = 5)
-
-        if upcoming_memories:
-            for memory in upcoming_memories:
-                # Convert ISO dates to a readable format
-                created = datetime.fromisoformat(memory["created_date"]).strftime("%B %d, %Y")
-                unlock = datetime.fromisoformat(memory["unlock_date"]).strftime("%B %d, %Y")
+        # Model/view list so refreshing only re-runs the query
+        self.upcoming_model = UpcomingMemoriesModel(self.memory_keeper, limit = 5, parent = self)
+        self.upcoming_view = QListView()
+        self.upcoming_view.setModel(self.upcoming_model)
+        self.upcoming_view.setItemDelegate(UpcomingMemoryDelegate(self.upcoming_view))
+        self.upcoming_view.setSelectionMode(QListView.NoSelection)
+        self.upcoming_view.setFocusPolicy(Qt.NoFocus)
+        self.upcoming_view.setUniformItemSizes(True)
+        self.upcoming_view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
 
-                memory_frame = QFrame()
-                memory_frame.setFrameShape(QFrame.StyledPanel)
-                memory_frame.setFrameShadow(QFrame.Raised)
-                memory_layout = QVBoxLayout(memory_frame)
+        self.no_upcoming_label = QLabel("You don't have any upcoming memories. Create one now!")
 
-                title_label = QLabel(memory["title"])
-                title_label.setFont(QFont("Arial", 11, QFont.Bold))
-
-                dates_label = QLabel(f"Created: {created} | Unlocks: {unlock}")
-
-                memory_layout.addWidget(title_label)
-                memory_layout.addWidget(dates_label)
-
-                upcoming_layout.addWidget(memory_frame)
-        else:
-            no_memories_label = QLabel("You don't have any upcoming memories. Create one now!")
-            upcoming_layout.addWidget(no_memories_label)
+        upcoming_layout.addWidget(self.upcoming_view)
+        upcoming_layout.addWidget(self.no_upcoming_label)
 
         layout.addWidget(upcoming_group)
 
+        # Fill in the stats and upcoming memories
+        self.update_memory_stats()
+        self.populate_upcoming_memories()
+
         # Quick actions section
         actions_group = QGroupBox("Quick Actions")
         actions_layout = QVBoxLayout(actions_group)
@@ -713,7 +1599,7 @@ class MemoryKeeperApp(QMainWindow):
         export_button.clicked.connect(self.export_memories)
 
         import_button = QPushButton("Import Memories")
-        import_button.setToolTip("Create a backup of all your memories")
+        import_button.setToolTip("Restore or merge memories from an exported backup")
         import_button.clicked.connect(self.import_memories)
 
         import_export_actions.addWidget(export_button)
@@ -729,6 +1615,28 @@ class MemoryKeeperApp(QMainWindow):
 
         return tab
     
+    def update_memory_stats(self):
+        """Update the dashboard statistics labels with the current memory counts."""
+        counts = self.memory_keeper.get_memory_count()
+
+        self.total_label.setText(f"Total Memories: {counts['total']}")
+        self.locked_label.setText(f"Locked:  {counts['locked']}")
+        self.unlocked_label.setText(f"Unlocked: {counts['unlocked']}")
+
+    def populate_upcoming_memories(self):
+        """Fill the dashboard's upcoming memories section."""
+        self.upcoming_model.reload()
+        row_count = self.upcoming_model.rowCount()
+
+        # Show the placeholder text instead of an empty list
+        self.upcoming_view.setVisible(row_count > 0)
+        self.no_upcoming_label.setVisible(row_count == 0)
+
+        if row_count:
+            # Size the list to fit its rows so the dashboard doesn't scroll
+            row_height = self.upcoming_view.sizeHintForRow(0)
+            self.upcoming_view.setFixedHeight(row_height * row_count + 2 * self.upcoming_view.frameWidth())
+
     def create_memory_form_tab(self):
         """Create the tab for creating new memories."""
         tab = QWidget()
@@ -778,9 +1686,7 @@ class MemoryKeeperApp(QMainWindow):
         self.category_combo = QComboBox()
 
         # Populate with categories from database
-        categories = self.memory_keeper.get_categories()
-        for category in categories:
-            self.category_combo.addItem(category["name"], category["id"])
+        self.fill_category_combo(self.category_combo)
 
         self.tags_input = QLineEdit()
         self.tags_input.setPlaceholderText("Enter tags separated by commas")
@@ -808,9 +1714,9 @@ class MemoryKeeperApp(QMainWindow):
         layout.addWidget(additional_group)
 
         # Submit button
-        submit_button = QPushButton("Create Memory")
-        submit_button.clicked.connect(self.save_memory)
-        layout.addWidget(submit_button)
+        self.create_memory_button = QPushButton("Create Memory")
+        self.create_memory_button.clicked.connect(self.save_memory)
+        layout.addWidget(self.create_memory_button)
 
         return tab
     
@@ -841,19 +1747,14 @@ class MemoryKeeperApp(QMainWindow):
         # Category filter
         category_label = QLabel("Category:")
         self.vault_category_filter = QComboBox()
-        self.vault_category_filter.addItem("All Categories", None)
 
         # Populate with categories from database
-        categories = self.memory_keeper.get_categories()
-        for category in categories:
-            self.vault_category_filter.addItem(category["name"], category["id"])
+        self.fill_category_combo(self.vault_category_filter, all_categories = True)
 
         # Sort options
         sort_label = QLabel("Sort by:")
         self.vault_sort_combo = QComboBox()
-        self.vault_sort_combo.addItems(["Unlock Date (Soonest)", "Unlock Date (Latest)", 
-                                        "Creation Date (Newest)", "Creation Date (Oldest)",
-                                         "Importance (Highest)", "Importance (Lowest)"])
+        self.vault_sort_combo.addItems(list(VAULT_SORT_OPTIONS))
         
         # Connect filters to update function
         self.vault_category_filter.currentIndexChanged.connect(self.refresh_vault_memories)
@@ -862,7 +1763,13 @@ class MemoryKeeperApp(QMainWindow):
         # Search box
         self.vault_search_box = QLineEdit()
         self.vault_search_box.setPlaceholderText("Search memories by title or tags...")
-        self.vault_search_box.textChanged.connect(self.refresh_vault_memories)
+        # Wait for a pause in typing before searching, so a typed word runs
+        # one query instead of one per keystroke
+        self.vault_search_timer = QTimer(self)
+        self.vault_search_timer.setSingleShot(True)
+        self.vault_search_timer.setInterval(200)
+        self.vault_search_timer.timeout.connect(self.refresh_vault_memories)
+        self.vault_search_box.textChanged.connect(self.vault_search_timer.start)
 
         # Arrange filter widgets
         filter_layout.addWidget(category_label)
@@ -873,29 +1780,70 @@ class MemoryKeeperApp(QMainWindow):
         layout.addWidget(filter_group)
         layout.addWidget(self.vault_search_box)
 
-        # Scrollable area for memory cards
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_content = QWidget()
+        # Memory cards are painted by a delegate, so only the visible ones
+        # cost anything no matter how many memories are in the vault
+        self.vault_model = VaultMemoryModel(self)
+        self.vault_delegate = VaultMemoryDelegate(self)
+        self.vault_delegate.unlock_clicked.connect(self.unlock_and_view_memory, Qt.QueuedConnection)
+        self.vault_delegate.delete_clicked.connect(self.confirm_delete_memory, Qt.QueuedConnection)
+
+        self.vault_view = QListView()
+        self.vault_view.setModel(self.vault_model)
+        self.vault_view.setItemDelegate(self.vault_delegate)
+        self.vault_view.setUniformItemSizes(True)
+        self.vault_view.setSelectionMode(QListView.NoSelection)
+        self.vault_view.setVerticalScrollMode(QListView.ScrollPerPixel)
+        layout.addWidget(self.vault_view, 1)
+
+        self.no_vault_memories_label = QLabel("No locked memories found with the current filters.")
+        self.no_vault_memories_label.setAlignment(Qt.AlignCenter)
+        self.no_vault_memories_label.hide()
+        layout.addWidget(self.no_vault_memories_label)
 
-        self.vault_memories_layout = QVBoxLayout(scroll_content)
-        self.vault_memories_layout.setAlignment(Qt.AlignTop)
+        return tab
 
-        scroll_area.setWidget(scroll_content)
-        layout.addWidget(scroll_area, 1)
+    def load_stale_tab(self, index):
+        """
+        Reload a tab's memories if they changed while it was hidden.
+
+        Args:
+            index: Index of the tab that became current
+        """
+        widget = self.tabs.widget(index)
+        if widget is self.dashboard_tab and "dashboard" in self.stale_tabs:
+            self.stale_tabs.discard("dashboard")
+            self.refresh_dashboard()
+        elif widget is self.vault_tab and "vault" in self.stale_tabs:
+            self.stale_tabs.discard("vault")
+            self.refresh_vault_memories()
+        elif widget is self.unlocked_tab and "unlocked" in self.stale_tabs:
+            self.stale_tabs.discard("unlocked")
+            self.load_unlocked_memories()
+
+    def refresh_memory_tabs(self):
+        """
+        Refresh the dashboard, vault and unlocked tabs after memories changed.
+
+        Hidden tabs are only marked stale. Updates are disabled on the tab
+        widget meanwhile, so the current tab is laid out and painted once.
+        Signals stay connected, since the unlocked list relies on them to
+        clear the memory shown next to it.
+        """
+        self.tabs.setUpdatesEnabled(False)
+        try:
+            self.refresh_dashboard()
+            self.refresh_vault_memories()
+            self.load_unlocked_memories()
+        finally:
+            self.tabs.setUpdatesEnabled(True)
 
-        # Initial load of memories
-        self.refresh_vault_memories()
-    
-        return tab
-    
     def refresh_vault_memories(self):
         """Refresh the list of memories in the vault tab based on the current filters."""
-        # Clear existing memory cards
-        for i in reversed(range(self.vault_memories_layout.count())):
-            widget = self.vault_memories_layout.itemAt(i).widget()
-            if widget:
-                widget.deleteLater()
+        # Wait until the tab is shown, and remember to refresh it then
+        if (self.import_running or "vault" in self.stale_tabs
+                or self.tabs.currentWidget() is not self.vault_tab):
+            self.stale_tabs.add("vault")
+            return
 
         # Get filter values
         category_id = self.vault_category_filter.currentData()
@@ -905,16 +1853,11 @@ class MemoryKeeperApp(QMainWindow):
         # Get locked memories with appropriate filters
         memories = self.get_filtered_locked_memories(category_id, sort_option, search_text)
 
-        if memories:
-            # Create a memory card for each memory
-            for memory in memories:
-                memory_card = self.create_memory_card(memory)
-                self.vault_memories_layout.addWidget(memory_card)
-        else:
-            # Show a message if no memories are found
-            no_memories_label = QLabel("No locked memories found with the current filters.")
-            no_memories_label.setAlignment(Qt.AlignCenter)
-            self.vault_memories_layout.addWidget(no_memories_label)
+        self.vault_model.set_memories(memories)
+
+        # Show a message instead of the list if no memories are found
+        self.vault_view.setVisible(bool(memories))
+        self.no_vault_memories_label.setVisible(not memories)
 
     def get_filtered_locked_memories(self, category_id = None, sort_option = "Unlock Date (Soonest)", search_text = ""):
         """
@@ -930,137 +1873,17 @@ class MemoryKeeperApp(QMainWindow):
         """
         
         # Convert sort option to parameters for the query
-        sort_field = "unlock_date"
-        sort_order = "ASC"
-
-        if "Creation Date" in sort_option:
-            sort_field = "created_date"
-        elif "Importance" in sort_option:
-            sort_field = "importance"
-            sort_order = "DESC"
-
-        if "Latest" in sort_option or "Oldest" in sort_option or "Newest" in sort_option:
-            sort_order = "DESC"
+        sort_field, sort_order = VAULT_SORT_OPTIONS.get(sort_option, ("unlock_date", "ASC"))
 
+        # The vault model pages through the matches itself, so ask for all of them
         return self.memory_keeper.get_locked_memories(
             category_id = category_id,
             sort_field = sort_field,
             sort_order = sort_order,
-            search_text = search_text
+            search_text = search_text,
+            limit = None
         )
 
-    def create_memory_card(self, memory):
-        """
-        Create a card widget for a locked memory.
-
-        Args:
-            memory: Dictionary containing memory information
-
-        Returns:
-            QFrame widget representing the memory
-        """
-        # Create card frame
-        card = QFrame()
-        card.setFrameShape(QFrame.StyledPanel)
-        card.setFrameShadow(QFrame.Raised)
-        card.setStyleSheet("QFrame { border: 1px solid #CCCCCC; border-radius: 8px; background-color: #F8F8F8; margin: 5px; }")
-
-        # Create layout for the new card
-        card_layout = QVBoxLayout(card)
-
-        # Format dates
-        created_date = datetime.fromisoformat(memory["created_date"]).strftime("%B %d, %Y")
-        unlock_date = datetime.fromisoformat(memory["unlock_date"]).strftime("%B %d, %Y")
-
-        # Days until unlock
-        days_until = (datetime.fromisoformat(memory["unlock_date"]) - datetime.now()).days
-        days_text = f"{days_until} days remaining" if days_until > 0 else "Unlocks today!"
-
-        # Create header with title and actions
-        header_layout = QHBoxLayout()
-
-        title_label = QLabel(memory["title"])
-        title_label.setFont(QFont("Arial", 12, QFont.Bold))
-
-        # Container for action buttons
-        buttons_layout = QHBoxLayout()
-
-        # Add unlock button if the memory is ready to be unlocked
-        if days_until <= 0:
-            unlock_button = QPushButton("Unlock Now")
-            unlock_button.setStyleSheet("background-color: #E0FFE0;")
-            unlock_button.clicked.connect(lambda: self.unlock_and_view_memory(memory["id"]))
-            buttons_layout.addWidget(unlock_button)
-
-            # Change the days text
-            days_text = "Ready to unlock now!"
-        else:
-            days_text = f"{days_until} days remaining"
-
-        # Add delete button
-        delete_button = QPushButton("Delete")
-        delete_button.setStyleSheet("background-color: #FFE0E0;")
-        delete_button.clicked.connect(lambda: self.confirm_delete_memory(memory["id"], is_locked = True))
-        buttons_layout.addWidget(delete_button)
-
-        header_layout.addWidget(title_label, 1)
-        header_layout.addLayout(buttons_layout)
-
-        # Info section
-        info_layout = QHBoxLayout()
-        
-        # Left side info
-        left_info = QVBoxLayout()
-        created_label = QLabel(f"Created: {created_date}")
-        unlock_label = QLabel(f"Unlocks: {unlock_date}")
-        left_info.addWidget(created_label)
-        left_info.addWidget(unlock_label)
-
-        # Right side info
-        right_info = QVBoxLayout()
-        countdown_label = QLabel(days_text)
-        countdown_label.setStyleSheet("font-weight: bold; color: #2C6694;")
-
-        # Get category name if available
-        category_name = "Uncategorized"
-        if memory.get("category"):
-            categories = self.memory_keeper.get_categories()
-            for category in categories:
-                if category["id"] == memory["category"]:
-                    category_name = category["name"]
-                    break
-
-        category_label = QLabel(f"Category: {category_name}")
-        right_info.addWidget(countdown_label)
-        right_info.addWidget(category_label)
-
-        # Add left and right info to the info layout
-        info_layout.addLayout(left_info)
-        info_layout.addStretch()
-        info_layout.addLayout(right_info)
-
-        # Add components to card layout
-        card_layout.addWidget(title_label)
-        card_layout.addLayout(info_layout)
-
-        # If the memory has importance, show stars
-        if "importance" in memory and memory ["importance"]:
-            importance = int(memory["importance"])
-            stars = "★" * importance + "☆" * (5 - importance)
-            importance_label = QLabel(stars)
-            importance_label.setStyleSheet("color:gold;")
-            card_layout.addWidget(importance_label)
-
-        # Add Tags if available
-        if memory.get("tags"):
-            tags_text = ", ".join(memory["tags"])
-            tags_label = QLabel(f"Tags: {tags_text}")
-            tags_label.setStyleSheet("font-style: italic; color: #666666;")
-            card_layout.addWidget(tags_label)
-
-        return card
-
-    
     def create_unlocked_tab(self):
         """Create the tab for viewing unlocked memories."""
         tab = QWidget()
@@ -1112,13 +1935,19 @@ class MemoryKeeperApp(QMainWindow):
         # Memory list
         self.unlocked_memory_list = QListWidget()
         self.unlocked_memory_list.setSelectionMode(QListWidget.SingleSelection)
+        # Every entry is the same two lines, so the list can size them all
+        # from the first one and lay out long lists in batches
+        self.unlocked_memory_list.setUniformItemSizes(True)
+        self.unlocked_memory_list.setLayoutMode(QListView.Batched)
+        self.unlocked_memory_list.setBatchSize(50)
         left_layout.addWidget(self.unlocked_memory_list, 1)  # Give it stretch
+        # List items by memory id, rebuilt along with the list
+        self.unlocked_items = {}
 
         # Connect signals AFTER creating widgets
         self.unlocked_filter_combo.currentIndexChanged.connect(self.filter_unlocked_memories)
         self.unlocked_category_filter.currentIndexChanged.connect(self.filter_unlocked_memories)
         self.unlocked_filter_combo.currentIndexChanged.connect(self.toggle_category_filter)
-        self.unlocked_memory_list.currentItemChanged.connect(self.display_unlocked_memory)
 
         # Right side - Memory details and response area
         right_widget = QWidget()
@@ -1131,11 +1960,11 @@ class MemoryKeeperApp(QMainWindow):
         self.unlocked_content_scroll = content_scroll  # Store reference
 
         # Create content widget and layout
-        content_widget = QWidget()
-        self.unlocked_content_widget = content_widget  # Store reference
-        self.memory_content_layout = QVBoxLayout(content_widget)  # Store reference
-        self.memory_content_layout.setAlignment(Qt.AlignTop)  # Align to top
-        content_scroll.setWidget(content_widget)
+        self.reset_memory_content()
+
+        # Shared by the date label of every response shown
+        self.response_date_font = QFont(content_scroll.font())
+        self.response_date_font.setBold(True)
 
         # Default content - shown when no memory is selected
         default_label = QLabel("Select a memory from the list to view its contents.")
@@ -1172,8 +2001,11 @@ class MemoryKeeperApp(QMainWindow):
         self.save_response_button = QPushButton("Save Response")
         self.save_response_button.setEnabled(False)  # Disabled until a memory is selected
 
-        # Connect signals AFTER creating widgets
+        # Connect signals AFTER creating widgets. Selecting a memory updates
+        # the content and response widgets, so it is connected once they
+        # all exist.
         self.save_response_button.clicked.connect(self.save_memory_response)
+        self.unlocked_memory_list.currentItemChanged.connect(self.display_unlocked_memory)
 
         # Add widgets to response layout
         response_layout.addWidget(response_label)
@@ -1198,10 +2030,6 @@ class MemoryKeeperApp(QMainWindow):
         # Store reference to the currently displayed memory
         self.current_memory_id = None
 
-        # Populate unlocked memories list
-        self.populate_categories_filter()
-        self.load_unlocked_memories()
-
         # Store a reference to this tab
         self.unlocked_tab_widget = tab
         
@@ -1212,45 +2040,89 @@ class MemoryKeeperApp(QMainWindow):
         show_category = self.unlocked_filter_combo.currentText() == "By Category"
         self.unlocked_category_filter.setVisible(show_category)
 
-        if show_category:
-            # Make sure categories are loaded
+        if show_category and not self.unlocked_category_filter.count():
+            # Load the categories the first time they are needed
             self.populate_categories_filter()
 
     def populate_categories_filter(self):
         """Populate the category filter dropdown."""
-        self.unlocked_category_filter.clear()
-        self.unlocked_category_filter.addItem("All Categories", None)
+        self.fill_category_combo(self.unlocked_category_filter, all_categories = True)
+
+    def fill_category_combo(self, combo, all_categories = False):
+        """
+        Fill a dropdown with the categories, keeping its selection if it still exists.
+
+        Signals are blocked while it is filled. The selection ends up as it
+        was, or on the first entry, so whatever the dropdown filters isn't
+        reloaded for every item added.
 
-        categories = self.memory_keeper.get_categories()
-        for category in categories:
-            self.unlocked_category_filter.addItem(category["name"], category["id"])
+        Args:
+            combo: The QComboBox to fill
+            all_categories: Whether to start with an "All Categories" entry
+        """
+        combo.blockSignals(True)
+        try:
+            selected = combo.currentData()
+            combo.clear()
+            if all_categories:
+                combo.addItem("All Categories", None)
+
+            for category in self.memory_keeper.get_categories():
+                combo.addItem(category["name"], category["id"])
+
+            combo.setCurrentIndex(max(combo.findData(selected), 0))
+        finally:
+            combo.blockSignals(False)
+
+    def reload_category_combos(self):
+        """Refill the category dropdowns after the categories changed."""
+        self.fill_category_combo(self.category_combo)
+        self.fill_category_combo(self.vault_category_filter, all_categories = True)
+        # The unlocked tab's filter is only filled once it has been used
+        if self.unlocked_category_filter.count():
+            self.populate_categories_filter()
     
     def load_unlocked_memories(self):
         """Load unlocked memories into the list widget."""
-        self.unlocked_memory_list.clear()
+        # Wait until the tab is shown, and remember to load it then
+        if (self.import_running or "unlocked" in self.stale_tabs
+                or self.tabs.currentWidget() is not self.unlocked_tab):
+            self.stale_tabs.add("unlocked")
+            return
 
         # Get Unlocked memories
         memories = self.get_filtered_unlocked_memories()
 
-        if memories:
-            for memory in memories:
-                # Create a list item for each memory
-                created_date = datetime.fromisoformat(memory["created_date"]).strftime("%B %d, %Y")
-                unlock_date = datetime.fromisoformat(memory["unlock_date"]).strftime("%B %d, %Y")
+        # Rebuild the list without repainting it for every item added. The
+        # signals stay connected so clearing the list still clears the
+        # memory shown next to it.
+        self.unlocked_memory_list.setUpdatesEnabled(False)
+        try:
+            self.unlocked_memory_list.clear()
+            self.unlocked_items = {}
 
-                # Format the item text
-                item_text = f"{memory['title']}\nCreated: {created_date} | Unlocked: {unlock_date}"
+            if memories:
+                for memory in memories:
+                    # Create a list item for each memory
+                    created_date = format_display_date(memory["created_date"])
+                    unlock_date = format_display_date(memory["unlock_date"])
 
-                # Create item and store the memory id as item date
-                item = QListWidgetItem(item_text)
-                item.setData(Qt.UserRole, memory["id"])
+                    # Format the item text
+                    item_text = f"{memory['title']}\nCreated: {created_date} | Unlocked: {unlock_date}"
 
-                self.unlocked_memory_list.addItem(item)
-        else:
-            # Add a placeholder item if no memories are found
-            placeholder = QListWidgetItem("No unlocked memories found")
-            placeholder.setFlags(placeholder.flags() & ~Qt.ItemIsSelectable)
-            self.unlocked_memory_list.addItem(placeholder)
+                    # Create item and store the memory id as item date
+                    item = QListWidgetItem(item_text)
+                    item.setData(Qt.UserRole, memory["id"])
+
+                    self.unlocked_memory_list.addItem(item)
+                    self.unlocked_items[memory["id"]] = item
+            else:
+                # Add a placeholder item if no memories are found
+                placeholder = QListWidgetItem("No unlocked memories found")
+                placeholder.setFlags(placeholder.flags() & ~Qt.ItemIsSelectable)
+                self.unlocked_memory_list.addItem(placeholder)
+        finally:
+            self.unlocked_memory_list.setUpdatesEnabled(True)
     
     def filter_unlocked_memories(self):
         """Apply filters to the unlocked memories list."""
@@ -1288,6 +2160,24 @@ class MemoryKeeperApp(QMainWindow):
 
         return self.memory_keeper.get_memories_with_filters(filter_params)
     
+    def reset_memory_content(self):
+        """
+        Put an empty content widget in the memory view.
+
+        The previous content widget is deleted along with everything on it
+        in one go, instead of deleting its children one at a time. It is
+        deleted later rather than right away because this can run from a
+        click on one of its own buttons.
+        """
+        old_widget = self.unlocked_content_scroll.takeWidget()
+        if old_widget:
+            old_widget.deleteLater()
+
+        self.unlocked_content_widget = QWidget()
+        self.memory_content_layout = QVBoxLayout(self.unlocked_content_widget)
+        self.memory_content_layout.setAlignment(Qt.AlignTop)  # Align to top
+        self.unlocked_content_scroll.setWidget(self.unlocked_content_widget)
+
     def display_unlocked_memory(self, current, previous):
         """
         Display the selected unlocked memory's content.
@@ -1301,29 +2191,13 @@ class MemoryKeeperApp(QMainWindow):
         self.current_memory_id = None
         
         # Clear the response inputs regardless of selection
-        if hasattr(self, 'response_text_edit'):
-            self.response_text_edit.clear()
-            self.response_text_edit.setEnabled(False)
-        
-        if hasattr(self, 'response_mood_combo'):
-            self.response_mood_combo.setEnabled(False)
-        
-        if hasattr(self, 'save_response_button'):
-            self.save_response_button.setEnabled(False)
-        
-        # Make sure we have a content layout to work with
-        if not hasattr(self, 'memory_content_layout') or not self.memory_content_layout:
-            # Create a new widget and layout
-            self.unlocked_content_widget = QWidget()
-            self.memory_content_layout = QVBoxLayout(self.unlocked_content_widget)
-            if hasattr(self, 'unlocked_content_scroll'):
-                self.unlocked_content_scroll.setWidget(self.unlocked_content_widget)
+        self.response_text_edit.clear()
+        self.response_text_edit.setEnabled(False)
+        self.response_mood_combo.setEnabled(False)
+        self.save_response_button.setEnabled(False)
         
-        # Clear current content safely
-        while self.memory_content_layout.count():
-            item = self.memory_content_layout.takeAt(0)
-            if item and item.widget():
-                item.widget().deleteLater()
+        # Clear current content
+        self.reset_memory_content()
         
         # Check if we have a valid selection
         if not current or not (current.flags() & Qt.ItemIsSelectable):
@@ -1339,21 +2213,16 @@ class MemoryKeeperApp(QMainWindow):
             self.current_memory_id = memory_id
             
             # Get the full memory details
-            memory = self.memory_keeper.get_memory_by_id(memory_id)
+            memory = self.memory_keeper.get_memory_by_id(memory_id, include_responses = True)
             if not memory:
                 error_label = QLabel("Error: Could not load memory details.")
                 self.memory_content_layout.addWidget(error_label)
                 return
             
             # Set up response inputs now that we have a valid memory
-            if hasattr(self, 'response_text_edit'):
-                self.response_text_edit.setEnabled(True)
-            
-            if hasattr(self, 'response_mood_combo'):
-                self.response_mood_combo.setEnabled(True)
-            
-            if hasattr(self, 'save_response_button'):
-                self.save_response_button.setEnabled(True)
+            self.response_text_edit.setEnabled(True)
+            self.response_mood_combo.setEnabled(True)
+            self.save_response_button.setEnabled(True)
             
             # Display the memory content
             self.display_memory_content(memory)
@@ -1370,7 +2239,7 @@ class MemoryKeeperApp(QMainWindow):
         Create and display the widgets for memory content.
 
         Args:
-            memory: Dictionary with memory details
+            memory: Dictionary with memory details, including its responses
         """
         try:
             # Memory Title
@@ -1381,24 +2250,18 @@ class MemoryKeeperApp(QMainWindow):
             # Delete button
             delete_button = QPushButton("Delete Memory")
             delete_button.setStyleSheet("background-color: #FFCCCC;")
-            delete_button.clicked.connect(lambda: self.confirm_delete_memory(memory["id"], is_locked=False))
+            delete_button.clicked.connect(self.delete_current_memory)
             self.memory_content_layout.addWidget(delete_button)
             
             # Memory metadata
-            created_date = datetime.fromisoformat(memory["created_date"]).strftime("%B %d, %Y")
-            unlock_date = datetime.fromisoformat(memory["unlock_date"]).strftime("%B %d, %Y")
+            created_date = format_display_date(memory["created_date"])
+            unlock_date = format_display_date(memory["unlock_date"])
             
             metadata_label = QLabel(f"Created: {created_date} | Unlocked: {unlock_date}")
             self.memory_content_layout.addWidget(metadata_label)
             
-            # Get category name
-            category_name = "Uncategorized"
-            if memory.get("category"):
-                categories = self.memory_keeper.get_categories()
-                for category in categories:
-                    if category["id"] == memory["category"]:
-                        category_name = category["name"]
-                        break
+            # Category name, joined in by get_memory_by_id
+            category_name = memory["category_name"] or "Uncategorized"
             
             category_label = QLabel(f"Category: {category_name}")
             self.memory_content_layout.addWidget(category_label)
@@ -1410,9 +2273,7 @@ class MemoryKeeperApp(QMainWindow):
             
             # Importance indicator if available
             if memory.get("importance"):
-                importance = int(memory["importance"])
-                stars = "★" * importance + "☆" * (5 - importance)
-                importance_label = QLabel(f"Importance: {stars}")
+                importance_label = QLabel(f"Importance: {format_importance(memory['importance'])}")
                 self.memory_content_layout.addWidget(importance_label)
             
             # Add a separator
@@ -1439,18 +2300,18 @@ class MemoryKeeperApp(QMainWindow):
             responses_label.setFont(QFont("Arial", 12, QFont.Bold))
             self.memory_content_layout.addWidget(responses_label)
             
-            # Get responses for this memory
-            responses = self.memory_keeper.get_responses_for_memory(memory["id"])
+            # Responses for this memory, loaded along with it
+            responses = memory["responses"]
             
             if responses:
                 for response in responses:
-                    response_date = datetime.fromisoformat(response["response_date"]).strftime("%B %d, %Y")
+                    response_date = format_display_date(response["response_date"])
                     date_label = QLabel(f"Response from {response_date}")
-                    date_label.setStyleSheet("font-weight: bold;")
+                    date_label.setFont(self.response_date_font)
                     self.memory_content_layout.addWidget(date_label)
                     
                     # Response mood if available
-                    if response.get("response_mood"):
+                    if response["response_mood"]:
                         mood_label = QLabel(f"Mood: {response['response_mood']}")
                         self.memory_content_layout.addWidget(mood_label)
                     
@@ -1545,83 +2406,143 @@ class MemoryKeeperApp(QMainWindow):
         mood = self.mood_combo.currentText()
         importance = self.importance_spin.value()
 
-        # Save the memory
-        try:
-            memory_id = self.memory_keeper.create_memory(
-                title = title,
-                content = content,
-                unlock_date = unlock_date,
-                category = category_id,
-                tags = tags,
-                mood = mood,
-                importance = importance
-            )
+        # Save the memory on the writer thread; the button stays disabled
+        # until it finishes so the same memory can't be submitted twice
+        self.create_memory_button.setEnabled(False)
+        worker = Worker(
+            self.memory_keeper.create_memory,
+            title = title,
+            content = content,
+            unlock_date = unlock_date,
+            category = category_id,
+            tags = tags,
+            mood = mood,
+            importance = importance
+        )
+        worker.signals.result.connect(lambda memory_id: self.handle_memory_saved(memory_id, unlock_date))
+        worker.signals.error.connect(self.handle_memory_save_error)
+        self.writer_pool.start(worker)
 
-            # Show success message
-            QMessageBox.information(self, "Memory Created",
-                                    "Your memory has been successfully saved and will unlock on the specified date.")
-            
-            # Clear the form
-            self.memory_title_input.clear()
-            self.memory_content_input.clear()
-            self.tags_input.clear()
+    def handle_memory_saved(self, memory_id, unlock_date):
+        """
+        Update the UI once a new memory has been written.
 
-            # Detemine if memory is immediately unlockable
-            is_unlockable = unlock_date <= datetime.now()
+        Args:
+            memory_id: ID of the newly created memory
+            unlock_date: When the memory becomes available
+        """
+        self.create_memory_button.setEnabled(True)
 
-            # Refresh all affected tabs
-            self.refresh_dashboard() # Always refresh the dashboard
+        # Show success message
+        QMessageBox.information(self, "Memory Created",
+                                "Your memory has been successfully saved and will unlock on the specified date.")
 
-            if is_unlockable:
-                # If the memory is immediately unlockable, process it now
-                self.memory_keeper.unlock_memory(memory_id)
-                self.load_unlocked_memories() # Refresh unlocked memories tab
-            else:
-                # Otherwise, it goes to the vaule
-                self.refresh_vault_memories() # Refresh vault tab
+        # Clear the form
+        self.memory_title_input.clear()
+        self.memory_content_input.clear()
+        self.tags_input.clear()
 
-            # Switch to the Dashboard tab to show the updated stats
-            self.tabs.setCurrentIndex(0)
+        # Detemine if memory is immediately unlockable
+        is_unlockable = unlock_date <= datetime.now()
 
+        if is_unlockable:
+            # If the memory is immediately unlockable, process it now
+            self.memory_keeper.unlock_memory(memory_id)
 
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save memory: {str(e)}")
+        # Refresh all affected tabs
+        self.refresh_dashboard() # Always refresh the dashboard
+
+        if is_unlockable:
+            self.load_unlocked_memories() # Refresh unlocked memories tab
+        else:
+            # Otherwise, it goes to the vaule
+            self.refresh_vault_memories() # Refresh vault tab
+
+        # Switch to the Dashboard tab to show the updated stats
+        self.tabs.setCurrentIndex(0)
+
+    def handle_memory_save_error(self, message):
+        """Report a memory that could not be saved and let the user retry."""
+        self.create_memory_button.setEnabled(True)
+        QMessageBox.critical(self, "Error", f"Failed to save memory: {message}")
 
     def check_unlockable_memories(self):
-        """Check if there are any memories ready to be unlocked."""
-        unlockable_memories = self.memory_keeper.get_unlockable_memories()
+        """Check in the background if there are any memories ready to be unlocked."""
+        # Skip this round if the previous check hasn't finished yet, or while
+        # an import is replacing the memories
+        if self.unlock_check_running or self.import_running:
+            return
+        self.unlock_check_running = True
+
+        worker = Worker(self.find_unlockable_memories)
+        worker.signals.result.connect(self.handle_unlockable_memories)
+        worker.signals.error.connect(self.handle_unlock_check_error)
+        QThreadPool.globalInstance().start(worker)
 
-         # First, unlock all the memories that are ready
+    def find_unlockable_memories(self):
+        """
+        Get the memories that are ready to be unlocked. Runs on a worker thread.
+
+        Returns:
+            List of memory rows, empty if nothing is ready
+        """
+        # Most checks find nothing, so probe before fetching full rows.
+        # Both queries use the same clock reading so they agree on "now".
+        now = datetime.now().isoformat()
+        if not self.memory_keeper.has_unlockable_memories(now = now):
+            return []
+        return self.memory_keeper.get_unlockable_memories(now = now)
+
+    def handle_unlock_check_error(self, message):
+        """Report a failed background unlock check."""
+        self.unlock_check_running = False
+        print(f"Error checking unlockable memories: {message}")
+
+    def handle_unlockable_memories(self, unlockable_memories):
+        """
+        Unlock the memories found by the background check and notify the user.
+
+        Args:
+            unlockable_memories: Memories that have reached their unlock date
+        """
+        self.unlock_check_running = False
+
+        # First, unlock all the memories that are ready
         unlocked_count = 0
-        if unlockable_memories:
-            for memory in unlockable_memories:
-                success = self.memory_keeper.unlock_memory(memory["id"])
-                if success:
-                    unlocked_count += 1
+        for memory in unlockable_memories:
+            success = self.memory_keeper.unlock_memory(memory["id"])
+            if success:
+                unlocked_count += 1
 
         # Only show the notification if we've actually unlocked some memories
         if unlocked_count > 0:
-            msg = QMessageBox()
-            msg.setIcon(QMessageBox.Information)
-            msg.setWindowTitle("Memories Unlocked")
+            # Unlocked memories leave the vault and change the stats
+            self.refresh_memory_tabs()
+
+            if self.unlocked_notice_box is None:
+                msg = QMessageBox(self)
+                msg.setIcon(QMessageBox.Information)
+                msg.setWindowTitle("Memories Unlocked")
+                msg.setInformativeText("Would you like to view them now?")
+                msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+                self.unlocked_notice_box = msg
+            msg = self.unlocked_notice_box
             msg.setText(f"{unlocked_count} memories have been unlocked!")
-            msg.setInformativeText("Would you like to view them now?")
-            msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
 
             if msg.exec_() == QMessageBox.Yes:
                 # Switch to the unlocked memories tab
                 self.tabs.setCurrentIndex(3)
-                # Refresh the unlocked memories list
-                self.load_unlocked_memories()
 
     def refresh_dashboard(self):
         """Refresh the dashboard with updated data."""
-        # This is a placeholder - in the real implementation, this will update the dashboard
-        # For now, we'll just recreate the dashboard tab
-        new_dashboard = self.create_dashboard_tab()
-        self.tabs.removeTab(0)
-        self.tabs.insertTab(0, new_dashboard, "Dashboard")
-        self.tabs.setCurrentIndex(0)
+        # Wait until the dashboard is shown, and remember to refresh it then
+        if self.import_running or self.tabs.currentWidget() is not self.dashboard_tab:
+            self.stale_tabs.add("dashboard")
+            return
+
+        # Update the existing widgets in place instead of rebuilding the tab
+        self.update_memory_stats()
+        self.populate_upcoming_memories()
 
     def confirm_delete_memory(self, memory_id, is_locked = True):
         """
@@ -1631,13 +2552,16 @@ class MemoryKeeperApp(QMainWindow):
             memory_id: ID of memory to delete
             is_locked: Whether the memory is in the locked vault (True) or in the unlocked tab (False)
         """
-        confirm = QMessageBox()
-        confirm.setIcon(QMessageBox.Warning)
-        confirm.setWindowTitle("Confirm Deletion")
-        confirm.setText("Are you sure you want to delete this memory?")
-        confirm.setInformativeText("This action cannot be undone. All content and responses associated with "
-                                    "this memory will be permanently deleted.")
-        confirm.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        if self.delete_confirm_box is None:
+            confirm = QMessageBox(self)
+            confirm.setIcon(QMessageBox.Warning)
+            confirm.setWindowTitle("Confirm Deletion")
+            confirm.setText("Are you sure you want to delete this memory?")
+            confirm.setInformativeText("This action cannot be undone. All content and responses associated with "
+                                        "this memory will be permanently deleted.")
+            confirm.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+            self.delete_confirm_box = confirm
+        confirm = self.delete_confirm_box
         confirm.setDefaultButton(QMessageBox.No)
 
         if confirm.exec_() == QMessageBox.Yes:
@@ -1666,8 +2590,14 @@ class MemoryKeeperApp(QMainWindow):
                     self.unlocked_memory_list.clearSelection()
 
             else:
-                QMessageBox.critical(self, "Error,"
+                QMessageBox.critical(self, "Error",
                                     "Failed to delete the memory. Please try again.")
+
+
+    def delete_current_memory(self):
+        """Offer to delete the unlocked memory that is currently shown."""
+        if self.current_memory_id:
+            self.confirm_delete_memory(self.current_memory_id, is_locked = False)
                 
     def unlock_and_view_memory(self, memory_id):
         """
@@ -1687,18 +2617,15 @@ class MemoryKeeperApp(QMainWindow):
                 # Refresh the vault to remove the unlocked memory
                 self.refresh_vault_memories()
                 
-                # Switch to the unlocked memories tab
-                self.tabs.setCurrentIndex(3)
-
-                # Refresh the unlocked memories list
+                # Switch to the unlocked memories tab, which reloads its
+                # list once it is current
                 self.load_unlocked_memories()
+                self.tabs.setCurrentIndex(3)
 
                 # Try to select and display the newly unlocked memory
-                for i in range(self.unlocked_memory_list.count()):
-                    item = self.unlocked_memory_list.item(i)
-                    if item.date(Qt.UserRole) == memory_id:
-                        self.unlocked_memory_list.setCurrentItem(item)
-                        break
+                item = self.unlocked_items.get(memory_id)
+                if item is not None:
+                    self.unlocked_memory_list.setCurrentItem(item)
             
             else:
                 QMessageBox.critical(self, "Error",
@@ -1713,16 +2640,41 @@ class MemoryKeeperApp(QMainWindow):
         # Initialize the import/export helper if it doesn't exist
         if not hasattr(self, 'import_export'):
             self.import_export = MemoryKeeperImportExport(self.memory_keeper)
-        
-        # Call the export function
-        success, message = self.import_export.export_database()
-        
+
+        # Ask user for export location
+        export_file, _ = QFileDialog.getSaveFileName(
+            self,
+            "Export Memories",
+            str(Path.home() / "MemoryKeeper_Export.zip"),
+            "Zip Files (*.zip)"
+        )
+
+        if not export_file:
+            return
+
+        # Write the archive on the thread pool so the window stays responsive
+        self.statusBar().showMessage("Exporting memories...")
+        worker = Worker(self.import_export.export_database, export_file)
+        worker.signals.result.connect(self.handle_export_finished)
+        worker.signals.error.connect(lambda message: self.handle_export_finished((False, f"Export failed: {message}")))
+        QThreadPool.globalInstance().start(worker)
+
+    def handle_export_finished(self, result):
+        """
+        Report the outcome of a background export.
+
+        Args:
+            result: Tuple (success: bool, message: str) from export_database
+        """
+        success, message = result
+        self.statusBar().showMessage("Ready")
+
         # Show result message
         if success:
             QMessageBox.information(self, "Export Complete", message)
         else:
             QMessageBox.warning(self, "Export Failed", message)
-        
+
         # Refresh the dashboard
         self.refresh_dashboard()
 
@@ -1733,38 +2685,106 @@ class MemoryKeeperApp(QMainWindow):
             self.import_export = MemoryKeeperImportExport(self.memory_keeper)
         
         # Ask user if they want to merge or replace
-        choice_msg = QMessageBox()
-        choice_msg.setIcon(QMessageBox.Question)
-        choice_msg.setWindowTitle("Import Options")
-        choice_msg.setText("How would you like to import memories?")
-        choice_msg.setInformativeText("You can either merge the imported memories with your existing collection, or replace your current memories entirely.")
-        
-        merge_button = choice_msg.addButton("Merge", QMessageBox.ActionRole)
-        replace_button = choice_msg.addButton("Replace", QMessageBox.ActionRole)
-        cancel_button = choice_msg.addButton("Cancel", QMessageBox.RejectRole)
+        if self.import_choice_box is None:
+            choice_msg = QMessageBox(self)
+            choice_msg.setIcon(QMessageBox.Question)
+            choice_msg.setWindowTitle("Import Options")
+            choice_msg.setText("How would you like to import memories?")
+            choice_msg.setInformativeText("You can either merge the imported memories with your existing collection, or replace your current memories entirely.")
+            
+            # The buttons are kept to tell which one was clicked
+            self.import_merge_button = choice_msg.addButton("Merge", QMessageBox.ActionRole)
+            self.import_replace_button = choice_msg.addButton("Replace", QMessageBox.ActionRole)
+            self.import_cancel_button = choice_msg.addButton("Cancel", QMessageBox.RejectRole)
+            self.import_choice_box = choice_msg
+        choice_msg = self.import_choice_box
         
         choice_msg.exec_()
         
         # Handle user choice
-        if choice_msg.clickedButton() == cancel_button:
+        if choice_msg.clickedButton() == self.import_cancel_button:
             return
         
-        merge_mode = (choice_msg.clickedButton() == merge_button)
+        merge_mode = (choice_msg.clickedButton() == self.import_merge_button)
+        
+        # Ask user for import file
+        import_file, _ = QFileDialog.getOpenFileName(
+            self, 
+            "Import Memories", 
+            str(Path.home()),
+            "Zip Files (*.zip)"
+        )
+        
+        if not import_file:
+            return
+        
+        # Confirm import
+        confirm_msg = QMessageBox(self)
+        confirm_msg.setIcon(QMessageBox.Warning)
+        confirm_msg.setWindowTitle("Confirm Import")
+        
+        if merge_mode:
+            confirm_msg.setText("Merge imported memories with your current memories?")
+            confirm_msg.setInformativeText("This will add the imported memories to your existing collection.")
+        else:
+            confirm_msg.setText("Importing will replace your current memories.")
+            confirm_msg.setInformativeText("Are you sure you want to proceed? This cannot be undone.")
+        
+        confirm_msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        confirm_msg.setDefaultButton(QMessageBox.No)
         
-        # Call the import function with the selected mode
-        success, message = self.import_export.import_database(merge=merge_mode)
+        if confirm_msg.exec_() != QMessageBox.Yes:
+            return
         
+        # Import on the writer thread so the window keeps painting and the
+        # import can't interleave with saving a memory. The tabs, Export and
+        # Import included, are disabled until it finishes so nothing reads
+        # the database while it is being rewritten.
+        self.import_running = True
+        self.tabs.setEnabled(False)
+        self.statusBar().showMessage("Importing memories...")
+        worker = Worker(self.import_export.import_database, import_file, merge = merge_mode)
+        worker.signals.result.connect(self.handle_import_finished)
+        worker.signals.error.connect(lambda message: self.handle_import_finished((False, f"Import failed: {message}")))
+        self.writer_pool.start(worker)
+
+    def handle_import_finished(self, result):
+        """
+        Report the outcome of a background import.
+
+        Args:
+            result: Tuple (success: bool, message: str) from import_database
+        """
+        success, message = result
+        self.import_running = False
+        self.tabs.setEnabled(True)
+        self.statusBar().showMessage("Ready")
+
+        # Catch up on the refreshes held off during the import. After a
+        # successful one every tab is out of date; the current tab reloads
+        # now and the others when they are next shown.
+        if success:
+            self.reload_category_combos()
+            self.stale_tabs.update(("dashboard", "vault", "unlocked"))
+        self.load_stale_tab(self.tabs.currentIndex())
+
         # Show result message
         if success:
             QMessageBox.information(self, "Import Complete", message)
-            
-            # Refresh all tabs
-            self.refresh_dashboard()
-            self.refresh_vault_memories()
-            self.load_unlocked_memories()
         else:
             QMessageBox.warning(self, "Import Failed", message)
-            
+
+    def closeEvent(self, event):
+        """Release the database connection when the window is closed."""
+        # Start no more unlock checks, and let pending writes and the export
+        # or unlock check running on the global pool finish before the
+        # connection goes away
+        self.unlock_timer.stop()
+        self.writer_pool.waitForDone()
+        QThreadPool.globalInstance().waitForDone()
+        self.memory_keeper.close()
+        super().closeEvent(event)
+
 class MemoryKeeperImportExport:
     """Helper class for handling import/export operations in MemoryKeeper."""
 
@@ -1777,62 +2797,78 @@ class MemoryKeeperImportExport:
         """
         self.memory_keeper = memory_keeper
 
-    def export_database(self):
+    def export_database(self, export_file, compression = "fast"):
         """
         Export the entire database to a zip archive.
-        
+
+        Touches no widgets, so it can run on a worker thread.
+
+        Args:
+            export_file: Path of the zip archive to write
+            compression: How hard to compress the database, one of the
+                         EXPORT_COMPRESSION names ("none", "fast" or "best")
+
         Returns:
             Tuple (success: bool, message: str) indicating operation result
         """
+        # The archive is written under a temporary name and only renamed to
+        # export_file once it is complete, so a failed export never leaves a
+        # truncated archive that looks like a backup
+        partial_file = f"{export_file}.partial"
         try:
-            # Ask user for export location
-            export_file, _ = QFileDialog.getSaveFileName(
-                None, 
-                "Export Memories", 
-                str(Path.home() / "MemoryKeeper_Export.zip"),
-                "Zip Files (*.zip)"
-            )
-            
-            if not export_file:
-                return False, "Export cancelled"
-            
-            # Get database path
-            db_path = self.memory_keeper.db_path
-            
-            # Create a temporary directory for the export
             with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                
-                # Copy database file
-                db_dest = temp_path / "memorykeeper.db"
-                shutil.copy2(db_path, db_dest)
-                
-                # Create metadata file
-                metadata = {
-                    "export_date": datetime.now().isoformat(),
-                    "app_version": "1.0",  # You can update this with actual version
-                    "memory_count": self.memory_keeper.get_memory_count()
-                }
-                
-                with open(temp_path / "metadata.json", "w") as f:
-                    json.dump(metadata, f, indent=2)
-                
-                # Create the zip file
-                with zipfile.ZipFile(export_file, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    # Add database and metadata files
-                    zipf.write(db_dest, "memorykeeper.db")
-                    zipf.write(temp_path / "metadata.json", "metadata.json")
-            
+                if self.memory_keeper.in_memory:
+                    # An in-memory database has no file to read, so copy it
+                    # into one first
+                    db_path = Path(temp_dir) / "memorykeeper.db"
+                    self.memory_keeper.backup_database(str(db_path))
+                    snapshot = None
+                else:
+                    # Hold a consistent view of the database file while it is
+                    # read, so it can go straight into the archive without a
+                    # temporary copy
+                    db_path = self.memory_keeper.db_path
+                    snapshot = self.memory_keeper.open_snapshot()
+                try:
+                    # Create metadata
+                    metadata = {
+                        "export_date": datetime.now().isoformat(),
+                        "app_version": "1.0",  # You can update this with actual version
+                        "memory_count": self.memory_keeper.get_memory_count()
+                    }
+
+                    # Create the zip file
+                    compress_type, compress_level = EXPORT_COMPRESSION[compression]
+                    with open(partial_file, "wb", buffering=ARCHIVE_BUFFER_SIZE) as archive, \
+                         zipfile.ZipFile(archive, 'w', compress_type, allowZip64=True,
+                                         compresslevel=compress_level) as zipf:
+                        # Stream the database file into the archive
+                        with open(db_path, "rb") as source, zipf.open("memorykeeper.db", "w", force_zip64=True) as target:
+                            shutil.copyfileobj(source, target, ARCHIVE_CHUNK_SIZE)
+
+                        # Add metadata, which is small and always worth compressing
+                        zipf.writestr("metadata.json", json.dumps(metadata, indent=2),
+                                      compress_type=zipfile.ZIP_DEFLATED)
+                finally:
+                    if snapshot is not None:
+                        snapshot.close()
+
+            os.replace(partial_file, export_file)
             return True, f"Successfully exported to {export_file}"
         
         except Exception as e:
+            if os.path.exists(partial_file):
+                os.remove(partial_file)
             return False, f"Export failed: {str(e)}"
         
-    def import_database(self, merge=True):
+    def import_database(self, import_file, merge=True):
         """
         Import a database from a previously exported zip archive.
         
+        Touches no widgets, so it can run on a worker thread.
+        
         Args:
+            import_file: Path of the zip archive to import
             merge: If True, merge imported memories with existing ones. 
                   If False, replace the existing database.
         
@@ -1840,35 +2876,6 @@ class MemoryKeeperImportExport:
             Tuple (success: bool, message: str) indicating operation result
         """
         try:
-            # Ask user for import file
-            import_file, _ = QFileDialog.getOpenFileName(
-                None, 
-                "Import Memories", 
-                str(Path.home()),
-                "Zip Files (*.zip)"
-            )
-            
-            if not import_file:
-                return False, "Import cancelled"
-            
-            # Confirm import
-            confirm_msg = QMessageBox()
-            confirm_msg.setIcon(QMessageBox.Warning)
-            confirm_msg.setWindowTitle("Confirm Import")
-            
-            if merge:
-                confirm_msg.setText("Merge imported memories with your current memories?")
-                confirm_msg.setInformativeText("This will add the imported memories to your existing collection.")
-            else:
-                confirm_msg.setText("Importing will replace your current memories.")
-                confirm_msg.setInformativeText("Are you sure you want to proceed? This cannot be undone.")
-            
-            confirm_msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
-            confirm_msg.setDefaultButton(QMessageBox.No)
-            
-            if confirm_msg.exec_() != QMessageBox.Yes:
-                return False, "Import cancelled"
-            
             # Get database path
             db_path = self.memory_keeper.db_path
             
@@ -1876,42 +2883,44 @@ class MemoryKeeperImportExport:
             with tempfile.TemporaryDirectory() as temp_dir:
                 temp_path = Path(temp_dir)
                 
-                # Extract the zip file
-                with zipfile.ZipFile(import_file, 'r') as zipf:
-                    zipf.extractall(temp_path)
-                
-                # Verify this is a valid export
-                if not (temp_path / "memorykeeper.db").exists():
-                    return False, "Invalid export file: Missing database"
-                
-                if not (temp_path / "metadata.json").exists():
-                    return False, "Invalid export file: Missing metadata"
-                
-                # Read metadata
-                with open(temp_path / "metadata.json", "r") as f:
-                    metadata = json.load(f)
-                
                 import_db_path = temp_path / "memorykeeper.db"
                 
+                with open(import_file, "rb", buffering=ARCHIVE_BUFFER_SIZE) as archive, \
+                     zipfile.ZipFile(archive, 'r') as zipf:
+                    # Verify this is a valid export
+                    names = set(zipf.namelist())
+                    if "memorykeeper.db" not in names:
+                        return False, "Invalid export file: Missing database"
+                    
+                    if "metadata.json" not in names:
+                        return False, "Invalid export file: Missing metadata"
+                    
+                    # Read metadata
+                    metadata = json.loads(zipf.read("metadata.json"))
+                    
+                    # Stream out the database, the only member written to disk
+                    with zipf.open("memorykeeper.db") as source, open(import_db_path, "wb") as target:
+                        shutil.copyfileobj(source, target, ARCHIVE_CHUNK_SIZE)
+                
                 if merge:
                     # Merge databases
-                    imported_count = self._merge_databases(db_path, import_db_path)
+                    imported_count = self.memory_keeper.merge_database(import_db_path)
                     return True, f"Successfully imported and merged {imported_count} memories"
                 else:
-                    # Close any existing database connections
-                    if hasattr(self.memory_keeper, 'get_db_connection'):
-                        try:
-                            conn = self.memory_keeper.get_db_connection()
-                            conn.close()
-                        except:
-                            pass
-                    
-                    # Create a backup of the current database
-                    backup_path = str(db_path) + ".backup"
-                    shutil.copy2(db_path, backup_path)
+                    # Create a backup of the current database. backup_path is
+                    # only set once the backup exists, so a failed backup is
+                    # never restored over the database.
+                    # An in-memory database has no file to keep the backup
+                    # next to, so it only lives as long as the import.
+                    if self.memory_keeper.in_memory:
+                        backup_file = str(temp_path / "backup.db")
+                    else:
+                        backup_file = str(db_path) + ".backup"
+                    self.memory_keeper.backup_database(backup_file)
+                    backup_path = backup_file
                     
                     # Replace the database
-                    shutil.copy2(import_db_path, db_path)
+                    self.memory_keeper.restore_database(import_db_path)
                     
                     memory_count = metadata.get("memory_count", {})
                     total_count = memory_count.get("total", "unknown")
@@ -1922,152 +2931,23 @@ class MemoryKeeperImportExport:
             # Restore from backup if available and not merging
             if not merge and 'backup_path' in locals():
                 try:
-                    shutil.copy2(backup_path, db_path)
+                    self.memory_keeper.restore_database(backup_path)
                 except Exception as backup_error:
                     return False, f"Import failed: {str(e)}\nAlso failed to restore backup: {str(backup_error)}"
             
             return False, f"Import failed: {str(e)}"
-        
-    def _merge_databases(self, current_db_path, import_db_path):
-        """
-        Merge two SQLite databases, importing memories from import_db to current_db.
-        
-        Args:
-            current_db_path: Path to the current database
-            import_db_path: Path to the database being imported
-        
-        Returns:
-            Number of memories imported
-        """
-        # Connect to current database
-        current_conn = sqlite3.connect(current_db_path)
-        current_cursor = current_conn.cursor()
-        
-        # Connect to imported database
-        import_conn = sqlite3.connect(import_db_path)
-        import_conn.row_factory = sqlite3.Row
-        import_cursor = import_conn.cursor()
-        
-        # Track how many memories we import
-        imported_count = 0
-        
-        try:
-            # Get all categories from the import database
-            import_cursor.execute("SELECT id, name, description, icon FROM categories")
-            categories = import_cursor.fetchall()
-            
-            # Get existing categories to avoid duplicates
-            current_cursor.execute("SELECT id, name FROM categories")
-            existing_categories = {row[1]: row[0] for row in current_cursor.fetchall()}
-            
-            # Import categories
-            category_mapping = {}  # Maps imported category IDs to existing/new category IDs
-            
-            for category in categories:
-                cat_id, cat_name, cat_desc, cat_icon = category
-                
-                # If category name already exists, map to existing ID
-                if cat_name in existing_categories:
-                    category_mapping[cat_id] = existing_categories[cat_name]
-                else:
-                    # Otherwise, insert the category with its original ID
-                    current_cursor.execute(
-                        "INSERT OR IGNORE INTO categories (id, name, description, icon) VALUES (?, ?, ?, ?)",
-                        (cat_id, cat_name, cat_desc, cat_icon)
-                    )
-                    category_mapping[cat_id] = cat_id
-            
-            # Get all memories from the import database
-            import_cursor.execute("""
-                SELECT id, title, content, media_path, created_date, unlock_date,
-                       unlock_type, unlock_conditions, is_unlocked, category, mood, importance
-                FROM memories
-            """)
-            memories = import_cursor.fetchall()
-            
-            # Get existing memory IDs to avoid duplicates
-            current_cursor.execute("SELECT id FROM memories")
-            existing_memory_ids = {row[0] for row in current_cursor.fetchall()}
-            
-            # Import memories
-            for memory in memories:
-                memory_dict = dict(memory)
-                memory_id = memory_dict['id']
-                
-                # Skip if memory already exists
-                if memory_id in existing_memory_ids:
-                    continue
-                
-                # Update category ID if needed
-                if memory_dict['category'] in category_mapping:
-                    memory_dict['category'] = category_mapping[memory_dict['category']]
-                
-                # Insert memory
-                current_cursor.execute("""
-                    INSERT INTO memories 
-                    (id, title, content, media_path, created_date, unlock_date,
-                     unlock_type, unlock_conditions, is_unlocked, category, mood, importance)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    memory_dict['id'], memory_dict['title'], memory_dict['content'],
-                    memory_dict['media_path'], memory_dict['created_date'], memory_dict['unlock_date'],
-                    memory_dict['unlock_type'], memory_dict['unlock_conditions'], memory_dict['is_unlocked'],
-                    memory_dict['category'], memory_dict['mood'], memory_dict['importance']
-                ))
-                
-                imported_count += 1
-            
-            # Get and import memory tags
-            for memory_id in [m['id'] for m in memories if m['id'] not in existing_memory_ids]:
-                import_cursor.execute("SELECT tag FROM memory_tags WHERE memory_id = ?", (memory_id,))
-                tags = import_cursor.fetchall()
-                
-                for tag_row in tags:
-                    current_cursor.execute(
-                        "INSERT INTO memory_tags (memory_id, tag) VALUES (?, ?)",
-                        (memory_id, tag_row[0])
-                    )
-            
-            # Get and import responses
-            for memory_id in [m['id'] for m in memories if m['id'] not in existing_memory_ids]:
-                import_cursor.execute("""
-                    SELECT id, response_content, response_date, response_mood
-                    FROM responses WHERE memory_id = ?
-                """, (memory_id,))
-                responses = import_cursor.fetchall()
-                
-                for response in responses:
-                    response_dict = dict(response)
-                    current_cursor.execute("""
-                        INSERT INTO responses 
-                        (id, memory_id, response_content, response_date, response_mood)
-                        VALUES (?, ?, ?, ?, ?)
-                    """, (
-                        response_dict['id'], memory_id, response_dict['response_content'],
-                        response_dict['response_date'], response_dict['response_mood']
-                    ))
-            
-            # Commit all changes
-            current_conn.commit()
-            
-            return imported_count
-        
-        except Exception as e:
-            # Roll back on error
-            current_conn.rollback()
-            raise e
-        
-        finally:
-            # Close connections
-            current_conn.close()
-            import_conn.close()
 
 def main():
     """Main entry point for MemoryKeeper"""
     print("Welcome to MemoryKeeper - Your Digital Time Capsule!")
 
     # Initialize the memory keeper backend
-    memory_keeper = MemoryKeeper()
+    if "--memory" in sys.argv[1:]:
+        # Preview mode: nothing is written to disk
+        print("Running with a temporary in-memory database.")
+        memory_keeper = MemoryKeeper(db_path=":memory:")
+    else:
+        memory_keeper = MemoryKeeper()
 
     try:
         # Create and run
@@ -1,53 +1,25 @@
 import unittest
-import os
+from unittest import mock
 import sqlite3
 import datetime
+import tempfile
+import zipfile
 from pathlib import Path
-from main import MemoryKeeper
+from main import (MemoryKeeper, MemoryKeeperImportExport, SQL_SELECT_UPCOMING, SQL_MERGE_NEW_IDS,
+                  SQL_MERGE_MEMORIES, SQL_MERGE_TAGS, SQL_MERGE_RESPONSES)
 
 class TestMemoryKeeper(unittest.TestCase):
     """Test cases for MemoryKeeper"""
 
     def setUp(self):
         """Set up a test environment before each test."""
-        # Use a test database file
-        self.test_db_path = "test_memory_keeper.db"
-        
-        # Remove the test database if it exists
-        try:
-            if os.path.exists(self.test_db_path):
-                os.remove(self.test_db_path)
-        except PermissionError:
-            print(f"Warning: Could not remove existing test database. It may be in use.")
-            # Generate a unique filename instead
-            self.test_db_path = f"test_memory_keeper_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
-        
-        # Create a fresh instance of MemoryKeeper for testing
-        self.memory_keeper = MemoryKeeper(db_path=self.test_db_path)
+        # Use a fresh in-memory database so tests never touch the disk
+        self.memory_keeper = MemoryKeeper(db_path=":memory:")
 
     def tearDown(self):
         """Clean up after each test."""
-        try:
-            # Force close any open connections
-            self.memory_keeper = None  # Remove reference to memory keeper
-            
-            # Force the garbage collector to run
-            import gc
-            gc.collect()
-            
-            # Wait a brief moment to allow OS to release file locks
-            import time
-            time.sleep(0.1)
-            
-            # Try to remove the test database
-            if os.path.exists(self.test_db_path):
-                try:
-                    os.remove(self.test_db_path)
-                    print(f"Successfully removed {self.test_db_path}")
-                except PermissionError:
-                    print(f"Warning: Could not remove test database {self.test_db_path}. It may still be in use.")
-        except Exception as e:
-            print(f"Error during tearDown: {e}")
+        # Dropping the only reference discards the in-memory database
+        self.memory_keeper = None
 
     def test_database_setup(self):
         """Test that the database is correctly set up with all the required tables."""
@@ -115,6 +87,46 @@ class TestMemoryKeeper(unittest.TestCase):
         
         conn.close()
 
+    def test_create_memory_cleans_tags(self):
+        """Test that blank and repeated tags are skipped when creating a memory."""
+        memory_id = self.memory_keeper.create_memory(
+            title = "Tag Test",
+            content = "Testing tag cleanup",
+            unlock_date = datetime.datetime.now() + datetime.timedelta(days = 7),
+            tags = [" travel", "travel", "", "  ", "family "]
+        )
+
+        conn = self.memory_keeper.get_db_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT tag FROM memory_tags WHERE memory_id = ?", (memory_id,))
+        saved_tags = sorted(row[0] for row in cursor.fetchall())
+
+        self.assertEqual(saved_tags, ["family", "travel"], "Tags were not cleaned up")
+
+    def test_create_memories_bulk(self):
+        """Test that a batch of memories and their tags is created in one call."""
+        unlock_date = datetime.datetime.now() + datetime.timedelta(days = 7)
+        memory_ids = self.memory_keeper.create_memories_bulk([
+            {"title": "Bulk 1", "content": "First", "unlock_date": unlock_date, "tags": ["a", "b"]},
+            {"title": "Bulk 2", "content": "Second", "unlock_date": unlock_date, "unlock_type": "interval"},
+            {"title": "Bulk 3", "content": "Third", "unlock_date": unlock_date, "tags": ["a"]}
+        ])
+
+        self.assertEqual(len(set(memory_ids)), 3, "Expected three distinct memory IDs")
+
+        conn = self.memory_keeper.get_db_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT COUNT(*) FROM memories")
+        self.assertEqual(cursor.fetchone()[0], 3, "Not all memories were created")
+
+        cursor.execute("SELECT COUNT(*) FROM memory_tags")
+        self.assertEqual(cursor.fetchone()[0], 3, "Not all tags were saved")
+
+        cursor.execute("SELECT unlock_type FROM memories WHERE id = ?", (memory_ids[1],))
+        self.assertEqual(cursor.fetchone()[0], "interval", "Unlock type wasn't saved correctly")
+
     def test_unlock_conditions(self):
         """Test that unlock conditions are properly stored."""
         # Create memory with an interval unlock type
@@ -162,5 +174,362 @@ class TestMemoryKeeper(unittest.TestCase):
         
         conn.close()
 
+    def test_memory_count(self):
+        """Test that memory counts are split correctly between locked and unlocked."""
+        counts = self.memory_keeper.get_memory_count()
+        self.assertEqual(counts, {"total": 0, "locked": 0, "unlocked": 0},
+                         "Counts should be zero for an empty database")
+
+        memory_ids = []
+        for i in range(3):
+            memory_ids.append(self.memory_keeper.create_memory(
+                title = f"Count Memory {i + 1}",
+                content = f"Content for count memory {i + 1}",
+                unlock_date = datetime.datetime.now() + datetime.timedelta(days = i + 1)
+            ))
+        self.memory_keeper.unlock_memory(memory_ids[0])
+
+        counts = self.memory_keeper.get_memory_count()
+        self.assertEqual(counts["total"], 3, "Total count doesn't match")
+        self.assertEqual(counts["locked"], 2, "Locked count doesn't match")
+        self.assertEqual(counts["unlocked"], 1, "Unlocked count doesn't match")
+
+        self.memory_keeper.delete_memory(memory_ids[1])
+
+        counts = self.memory_keeper.get_memory_count()
+        self.assertEqual(counts, {"total": 2, "locked": 1, "unlocked": 1},
+                         "Counts were not updated after deleting a memory")
+
+    def test_delete_memory_removes_tags_and_responses(self):
+        """Test that deleting a memory also deletes its tags and responses."""
+        memory_id = self.memory_keeper.create_memory(
+            title = "Delete Me",
+            content = "Short-lived",
+            unlock_date = datetime.datetime.now() - datetime.timedelta(days = 1),
+            tags = ["gone"]
+        )
+        self.memory_keeper.unlock_memory(memory_id)
+        self.memory_keeper.add_response(memory_id, "A response")
+
+        self.assertTrue(self.memory_keeper.delete_memory(memory_id), "Delete reported failure")
+        self.assertFalse(self.memory_keeper.delete_memory(memory_id), "Deleting twice should report failure")
+
+        cursor = self.memory_keeper.get_db_connection().cursor()
+        cursor.execute("SELECT COUNT(*) FROM memory_tags")
+        self.assertEqual(cursor.fetchone()[0], 0, "Tags were left behind")
+        cursor.execute("SELECT COUNT(*) FROM responses")
+        self.assertEqual(cursor.fetchone()[0], 0, "Responses were left behind")
+
+    def test_memory_with_responses(self):
+        """Test that a memory can be fetched together with its responses, newest first."""
+        memory_id = self.memory_keeper.create_memory(
+            title = "Answered",
+            content = "Reply to me",
+            unlock_date = datetime.datetime.now() - datetime.timedelta(days = 1),
+            tags = ["reply"]
+        )
+        self.memory_keeper.unlock_memory(memory_id)
+
+        memory = self.memory_keeper.get_memory_by_id(memory_id, include_responses = True)
+        self.assertEqual(memory["responses"], [], "A memory without responses should have an empty list")
+
+        self.memory_keeper.add_response(memory_id, "First", mood = "Happy")
+        self.memory_keeper.add_response(memory_id, "Second")
+
+        memory = self.memory_keeper.get_memory_by_id(memory_id, include_responses = True)
+        self.assertEqual(memory["tags"], ["reply"])
+        self.assertEqual([r["response_content"] for r in memory["responses"]], ["Second", "First"],
+                         "Responses should be newest first")
+        self.assertEqual(memory["responses"][1]["response_mood"], "Happy")
+        self.assertNotIn("responses", self.memory_keeper.get_memory_by_id(memory_id),
+                         "Responses should only be loaded when asked for")
+
+        # Viewing the memory again is served from the cache, which callers can't change
+        memory["responses"].clear()
+        memory = self.memory_keeper.get_memory_by_id(memory_id, include_responses = True)
+        self.assertEqual(len(memory["responses"]), 2, "Cached memory was changed by a caller")
+
+    def test_memories_include_category_name(self):
+        """Test that memories come back with the name of their category."""
+        category = self.memory_keeper.get_categories()[0]
+        unlock_date = datetime.datetime.now() + datetime.timedelta(days = 1)
+        memory_id = self.memory_keeper.create_memory("Filed", "Content", unlock_date, category = category["id"])
+        self.memory_keeper.create_memory("Loose", "Content", unlock_date + datetime.timedelta(days = 1))
+
+        names = [m["category_name"] for m in self.memory_keeper.get_locked_memories()]
+        self.assertEqual(names, [category["name"], None], "Category names don't match")
+        self.assertEqual(self.memory_keeper.get_memory_by_id(memory_id)["category_name"], category["name"])
+
+    def test_locked_memories_search(self):
+        """Test that the vault search matches titles and tags regardless of case."""
+        unlock_date = datetime.datetime.now() + datetime.timedelta(days = 3)
+        self.memory_keeper.create_memory("Beach Trip", "Sand", unlock_date, tags = ["Summer", "fun"])
+        self.memory_keeper.create_memory("Work", "Desk", unlock_date, tags = ["office", "meetings, calls"])
+
+        titles = [m["title"] for m in self.memory_keeper.get_locked_memories(search_text = "beach")]
+        self.assertEqual(titles, ["Beach Trip"], "Title search failed")
+
+        memories = self.memory_keeper.get_locked_memories(search_text = "SUMMER")
+        self.assertEqual([m["title"] for m in memories], ["Beach Trip"], "Tag search failed")
+        self.assertEqual(sorted(memories[0]["tags"]), ["Summer", "fun"], "Search should keep all tags of a match")
+
+        memories = self.memory_keeper.get_locked_memories(search_text = "calls")
+        self.assertEqual(sorted(memories[0]["tags"]), ["meetings, calls", "office"],
+                         "Tags containing commas should not be split")
+
+        self.assertEqual(self.memory_keeper.get_locked_memories(search_text = "zzz"), [],
+                         "Search should not match unrelated memories")
+
+    def test_locked_memories_sorting(self):
+        """Test that the vault sorts by the allowed fields and ignores anything else."""
+        now = datetime.datetime.now()
+        for i, importance in enumerate([2, 5, 1]):
+            self.memory_keeper.create_memory(f"Sort {i}", "Content", now + datetime.timedelta(days = i + 1),
+                                             importance = importance)
+
+        def importances(sort_field, sort_order):
+            memories = self.memory_keeper.get_locked_memories(sort_field = sort_field, sort_order = sort_order)
+            return [m["importance"] for m in memories]
+
+        self.assertEqual(importances("importance", "DESC"), [5, 2, 1], "Highest importance should come first")
+        self.assertEqual(importances("importance", "ASC"), [1, 2, 5], "Lowest importance should come first")
+        self.assertEqual(importances("title; DROP TABLE memories", "ASC"), [2, 5, 1],
+                         "Unknown sort fields should fall back to soonest unlock")
+
+    def test_locked_memories_follow_writes(self):
+        """Test that the vault list reflects creates, unlocks and deletes after it was loaded."""
+        now = datetime.datetime.now()
+        first_id = self.memory_keeper.create_memory("First", "Content", now + datetime.timedelta(days = 1))
+        memories = self.memory_keeper.get_locked_memories()
+        self.assertEqual([m["title"] for m in memories], ["First"])
+
+        # Changing a returned memory must not leak into later results
+        memories[0]["title"] = "Changed"
+        memories[0]["tags"].append("changed")
+        self.assertEqual(self.memory_keeper.get_locked_memories()[0]["title"], "First")
+        self.assertEqual(self.memory_keeper.get_locked_memories()[0]["tags"], [])
+
+        second_id = self.memory_keeper.create_memory("Second", "Content", now + datetime.timedelta(days = 2))
+        self.assertEqual([m["title"] for m in self.memory_keeper.get_locked_memories()], ["First", "Second"],
+                         "New memory missing from the vault")
+
+        self.memory_keeper.unlock_memory(first_id)
+        self.assertEqual([m["title"] for m in self.memory_keeper.get_locked_memories()], ["Second"],
+                         "Unlocked memory still in the vault")
+
+        self.memory_keeper.delete_memory(second_id)
+        self.assertEqual(self.memory_keeper.get_locked_memories(), [], "Deleted memory still in the vault")
+
+    def test_memories_with_filters(self):
+        """Test that the unlocked memory filters narrow the results."""
+        now = datetime.datetime.now()
+        recent = self.memory_keeper.create_memory("Recent", "New", now - datetime.timedelta(days = 2))
+        old = self.memory_keeper.create_memory("Old", "Aged", now - datetime.timedelta(days = 90))
+        for memory_id in (recent, old):
+            self.memory_keeper.unlock_memory(memory_id)
+        self.memory_keeper.add_response(old, "Still remember this")
+
+        def titles(filters):
+            return [m["title"] for m in self.memory_keeper.get_memories_with_filters(filters)]
+
+        self.assertEqual(titles({"is_unlocked": 1}), ["Recent", "Old"], "Unlocked memories not listed by unlock date")
+        cutoff = (now - datetime.timedelta(days = 30)).isoformat()
+        self.assertEqual(titles({"is_unlocked": 1, "unlock_after_date": cutoff}), ["Recent"],
+                         "Unlock date filter was ignored")
+        self.assertEqual(titles({"is_unlocked": 1, "has_responses": True}), ["Old"], "Response filter failed")
+        self.assertEqual(titles({"is_unlocked": 1, "has_responses": False}), ["Recent"], "Response filter failed")
+
+    def test_legacy_schema_upgrade(self):
+        """Test that tables from older databases are upgraded without losing rows."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            legacy_db_path = str(Path(temp_dir) / "legacy.db")
+
+            # Build a database with the original rowid table definitions
+            conn = sqlite3.connect(legacy_db_path)
+            conn.executescript('''
+                CREATE TABLE memories (
+                    id TEXT PRIMARY KEY, title TEXT NOT NULL, content TEXT, media_path TEXT,
+                    created_date TEXT NOT NULL, unlock_date TEXT NOT NULL, unlock_type TEXT NOT NULL,
+                    unlock_conditions TEXT, is_unlocked INTEGER DEFAULT 0, category TEXT,
+                    mood TEXT, importance INTEGER DEFAULT 3
+                );
+                CREATE TABLE memory_tags (
+                    memory_id TEXT NOT NULL, tag TEXT NOT NULL,
+                    PRIMARY KEY (memory_id, tag),
+                    FOREIGN KEY (memory_id) REFERENCES memories(id)
+                );
+                CREATE TABLE categories (
+                    id TEXT PRIMARY KEY, name TEXT UNIQUE NOT NULL, description TEXT, icon TEXT
+                );
+                INSERT INTO categories VALUES ('cat-1', 'Letter', 'Messages', 'envelope');
+                INSERT INTO memories (id, title, created_date, unlock_date, unlock_type, category)
+                VALUES ('mem-1', 'Old Memory', '2020-01-01T00:00:00', '2030-01-01T00:00:00', 'date', 'cat-1');
+                INSERT INTO memory_tags VALUES ('mem-1', 'legacy');
+                CREATE TABLE responses (
+                    id TEXT PRIMARY KEY, memory_id TEXT NOT NULL, response_content TEXT NOT NULL,
+                    response_date TEXT NOT NULL, response_mood TEXT,
+                    FOREIGN KEY (memory_id) REFERENCES memories (id)
+                );
+                INSERT INTO responses VALUES ('resp-1', 'mem-1', 'Hello', '2031-01-01T00:00:00', NULL);
+            ''')
+            conn.commit()
+            conn.close()
+
+            memory_keeper = MemoryKeeper(db_path=legacy_db_path)
+            try:
+                conn = memory_keeper.get_db_connection()
+                cursor = conn.cursor()
+
+                cursor.execute("SELECT name, sql FROM sqlite_master WHERE type = 'table'")
+                tables = {row[0]: row[1] for row in cursor.fetchall()}
+                self.assertIn("WITHOUT ROWID", tables["memory_tags"], "memory_tags was not upgraded")
+                self.assertIn("WITHOUT ROWID", tables["categories"], "categories was not upgraded")
+                self.assertNotIn("memory_tags_old", tables, "Temporary upgrade table was left behind")
+                self.assertIn("ON DELETE CASCADE", tables["responses"], "responses was not upgraded")
+
+                cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'responses'")
+                self.assertIn("idx_responses_memory", [row[0] for row in cursor.fetchall()],
+                              "Index on the upgraded responses table is missing")
+
+                cursor.execute("SELECT tag FROM memory_tags WHERE memory_id = 'mem-1'")
+                self.assertEqual([row[0] for row in cursor.fetchall()], ["legacy"], "Tags were lost in the upgrade")
+
+                cursor.execute("SELECT id FROM categories WHERE name = 'Letter'")
+                self.assertEqual(cursor.fetchone()[0], "cat-1", "Existing category was lost in the upgrade")
+
+                self.assertTrue(memory_keeper.delete_memory("mem-1"), "Upgraded memory could not be deleted")
+                cursor.execute("SELECT COUNT(*) FROM responses")
+                self.assertEqual(cursor.fetchone()[0], 0, "Delete did not cascade to upgraded responses")
+            finally:
+                memory_keeper.close()
+
+    def test_export_database(self):
+        """Test that an export archive holds a readable copy of the database and its metadata."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            memory_keeper = MemoryKeeper(db_path = str(Path(temp_dir) / "export.db"))
+            memory_keeper.create_memory("Exported", "Content", datetime.datetime.now() + datetime.timedelta(days = 1))
+            import_export = MemoryKeeperImportExport(memory_keeper)
+
+            for compression in ("none", "fast", "best"):
+                export_file = Path(temp_dir) / f"export-{compression}.zip"
+                success, message = import_export.export_database(export_file, compression = compression)
+                self.assertTrue(success, message)
+
+                with zipfile.ZipFile(export_file) as zipf:
+                    self.assertEqual(sorted(zipf.namelist()), ["memorykeeper.db", "metadata.json"])
+                    zipf.extract("memorykeeper.db", Path(temp_dir) / compression)
+
+                conn = sqlite3.connect(Path(temp_dir) / compression / "memorykeeper.db")
+                self.assertEqual(conn.execute("SELECT title FROM memories").fetchall(), [("Exported",)],
+                                 f"Exported database is missing the memory ({compression})")
+                conn.close()
+
+            # An export that fails part way leaves nothing behind
+            failed_file = Path(temp_dir) / "failed.zip"
+            with mock.patch("main.shutil.copyfileobj", side_effect = OSError("Disk full")):
+                success, message = import_export.export_database(failed_file)
+            self.assertFalse(success)
+            self.assertEqual(sorted(path.name for path in Path(temp_dir).glob("failed.zip*")), [])
+
+            memory_keeper.close()
+
+    def test_in_memory_export_and_merge(self):
+        """Test that an in-memory database can be exported and merged into."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            unlock_date = datetime.datetime.now() + datetime.timedelta(days = 1)
+            self.memory_keeper.create_memory("In memory", "Content", unlock_date)
+            import_export = MemoryKeeperImportExport(self.memory_keeper)
+
+            export_file = Path(temp_dir) / "export.zip"
+            success, message = import_export.export_database(export_file)
+            self.assertTrue(success, message)
+            with zipfile.ZipFile(export_file) as zipf:
+                zipf.extract("memorykeeper.db", temp_dir)
+
+            imported = MemoryKeeper(db_path = str(Path(temp_dir) / "imported.db"))
+            imported.create_memory("From file", "Content", unlock_date)
+            imported.close()
+
+            # The exported copy holds the one existing memory, so only the new one is added
+            self.assertEqual(self.memory_keeper.merge_database(Path(temp_dir) / "memorykeeper.db"), 0)
+            self.assertEqual(self.memory_keeper.merge_database(imported.db_path), 1)
+            self.assertEqual(self.memory_keeper.get_memory_count()["total"], 2)
+
+    def test_merge_databases(self):
+        """Test that merging copies new memories with their tags and responses and skips existing ones."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            current = MemoryKeeper(db_path = str(Path(temp_dir) / "current.db"))
+            imported = MemoryKeeper(db_path = str(Path(temp_dir) / "imported.db"))
+            unlock_date = datetime.datetime.now() - datetime.timedelta(days = 1)
+
+            shared_id = current.create_memory("Shared", "Content", unlock_date)
+            imported.get_db_connection().execute(
+                "INSERT INTO memories (id, title, content, created_date, unlock_date, unlock_type, is_unlocked) "
+                "VALUES (?, 'Shared', 'Content', ?, ?, 'date', 0)",
+                (shared_id, unlock_date.isoformat(), unlock_date.isoformat()))
+            new_id = imported.create_memory("New", "Content", unlock_date, tags = ["one", "two"])
+            imported.unlock_memory(new_id)
+            imported.add_response(new_id, "Reply", "Happy")
+            imported.close()
+
+            imported_count = current.merge_database(imported.db_path)
+
+            self.assertEqual(imported_count, 1, "Existing memory was imported again")
+            self.assertEqual(current.get_memory_count()["total"], 2)
+            memory = current.get_memory_by_id(new_id, include_responses = True)
+            self.assertEqual(sorted(memory["tags"]), ["one", "two"])
+            self.assertEqual([r["response_content"] for r in memory["responses"]], ["Reply"])
+
+            current.close()
+
+    def test_backup_and_restore_database(self):
+        """Test that a backup can be restored over the live database."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            memory_keeper = MemoryKeeper(db_path = str(Path(temp_dir) / "live.db"))
+            unlock_date = datetime.datetime.now() + datetime.timedelta(days = 1)
+            kept_id = memory_keeper.create_memory("Kept", "Content", unlock_date)
+
+            backup_path = str(Path(temp_dir) / "live.db.backup")
+            memory_keeper.backup_database(backup_path)
+            memory_keeper.create_memory("Later", "Content", unlock_date)
+            self.assertEqual(memory_keeper.get_memory_count()["total"], 2)
+
+            memory_keeper.restore_database(backup_path)
+            self.assertEqual(memory_keeper.get_memory_count()["total"], 1, "Restore left the later memory behind")
+            self.assertEqual(memory_keeper.get_memory_by_id(kept_id)["title"], "Kept")
+
+            memory_keeper.close()
+
+    def test_upcoming_query_uses_index(self):
+        """Test that the upcoming memories query is served by the covering index."""
+        conn = self.memory_keeper.get_db_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("EXPLAIN QUERY PLAN " + SQL_SELECT_UPCOMING, (datetime.datetime.now().isoformat(), 10))
+        plan = " ".join(row[3] for row in cursor.fetchall())
+
+        self.assertIn("COVERING INDEX idx_memories_locked", plan,
+                      "Upcoming memories query does not use the covering index")
+        self.assertNotIn("TEMP B-TREE", plan, "Upcoming memories query needs a separate sort")
+
+    def test_merge_queries_use_indexes(self):
+        """Test that the merge looks up memories, tags and responses by index instead of scanning."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            MemoryKeeper(db_path = str(Path(temp_dir) / "imported.db")).close()
+            conn = self.memory_keeper.get_db_connection()
+            cursor = conn.cursor()
+            cursor.execute("ATTACH DATABASE ? AS imp", (str(Path(temp_dir) / "imported.db"),))
+            cursor.execute(SQL_MERGE_NEW_IDS)
+
+            for name, sql in [("memories", SQL_MERGE_MEMORIES), ("tags", SQL_MERGE_TAGS),
+                              ("responses", SQL_MERGE_RESPONSES)]:
+                cursor.execute("EXPLAIN QUERY PLAN " + sql)
+                plan = [row[3] for row in cursor.fetchall()]
+                scans = [step for step in plan if step.startswith("SCAN") and "merge_ids" not in step]
+                self.assertEqual(scans, [], f"Merging {name} scans a table: {plan}")
+
+            cursor.execute("DROP TABLE temp.merge_ids")
+            cursor.execute("DETACH DATABASE imp")
+
 if __name__=="__main__":
     unittest.main()
\ No newline at end of file